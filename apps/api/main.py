@@ -10,12 +10,14 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
 
-from fastapi import FastAPI, HTTPException, Body, Path, Depends, UploadFile, File
-from fastapi.responses import StreamingResponse, PlainTextResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Body, Path, Depends, UploadFile, File, Response
+from fastapi.responses import StreamingResponse, PlainTextResponse, JSONResponse, ORJSONResponse
+import orjson
 from prometheus_client import Counter, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from sqlalchemy import select, func, desc, and_, or_
 import numpy as np
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 # Local imports
 from . import config
@@ -68,14 +70,14 @@ if not HAS_HEAVY:
 
 # Additional imports
 from libs.collectors.web_fallback import fetch_with_fallback as web_fetch_with_fallback
-from libs.crawlers.crawler import polite_crawl
+from libs.crawlers.crawler import polite_crawl, iter_crawl
 from libs.crawlers.onion_crawler import crawl_onion
 from libs.common.fallback import run_with_fallbacks
 from libs.collectors.social.nitter_search import nitter_search
 from libs.collectors.reddit_old import old_reddit_top
 from libs.collectors.wayback import latest_snapshot as wb_latest
 from libs.collectors.wayback_fetch import fetch_wayback_text
-from libs.collectors.rss_multi import fetch_many as rss_fetch_many
+from libs.collectors.rss_multi import fetch_many as rss_fetch_many, iter_many as rss_iter_many
 from libs.collectors.reddit import fetch_subreddit_json
 from libs.collectors.youtube_rss import fetch_channel as youtube_fetch_channel
 from libs.collectors.wayback import latest_snapshot
@@ -102,12 +104,45 @@ app = FastAPI(
     title=config.APP_TITLE,
     version=config.APP_VERSION,
     description="B-Search Intelligence API for data collection and analysis",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serialization skips jsonable_encoder + stdlib json on every
+    # response, roughly halving serialization cost on list-heavy endpoints
+    default_response_class=ORJSONResponse,
 )
 
 # Prometheus metrics
 REQS = Counter("api_requests_total", "Total API requests", ["endpoint"])
 HEALTH = Gauge("app_health", "Health status")
+
+# Rows per INSERT/commit when streaming collector output into the DB
+INSERT_BATCH_SIZE = 1000
+
+
+def _insert_items_batched(db, rows, batch_size: int = INSERT_BATCH_SIZE) -> List[str]:
+    """Insert item rows from an iterator in fixed-size batches.
+
+    Consumes a stream of {"project_id", "content", "meta"} dicts, assigns ids
+    client-side, and executes one multi-row INSERT per batch with a commit
+    after each. Peak memory stays at O(batch_size) no matter how large the
+    collector stream is, and a mid-stream failure keeps previously committed
+    rows. Returns the generated item ids as strings.
+    """
+    saved: List[str] = []
+    batch: List[dict] = []
+    insert_stmt = Item.__table__.insert()
+    for row in rows:
+        row.setdefault("id", uuid.uuid4())
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.execute(insert_stmt, batch)
+            db.commit()
+            saved.extend(str(r["id"]) for r in batch)
+            batch = []
+    if batch:
+        db.execute(insert_stmt, batch)
+        db.commit()
+        saved.extend(str(r["id"]) for r in batch)
+    return saved
 RUN_ALL_REQS = Counter("api_run_all_requests_total", "Total run_all requests")
 RUN_ALL_COLLECTOR_SUCCESS = Counter("api_run_all_collector_success_total", "Per-collector successes", ["module"])
 RUN_ALL_COLLECTOR_FAILURE = Counter("api_run_all_collector_failure_total", "Per-collector failures", ["module"])
@@ -191,11 +226,11 @@ def _project_to_dict(p) -> Dict[str, Any]:
         return {"id": None, "name": "", "created_at": None, "item_count": 0}
 
 
-@app.get("/healthz", response_model=HealthResponse)
-def healthz() -> HealthResponse:
+@app.get("/healthz")
+def healthz() -> Dict[str, Any]:
     """Health check endpoint"""
     HEALTH.set(1)
-    return HealthResponse()
+    return {"status": "ok"}
 
 
 @app.get("/metrics")
@@ -203,8 +238,8 @@ def metrics() -> PlainTextResponse:
     """Prometheus metrics endpoint"""
     return PlainTextResponse(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
-@app.post("/projects", response_model=ProjectResponse)
-def create_project(request: ProjectCreate) -> ProjectResponse:
+@app.post("/projects")
+def create_project(request: ProjectCreate) -> Dict[str, Any]:
     """
     Create a new project.
 
@@ -218,13 +253,15 @@ def create_project(request: ProjectCreate) -> ProjectResponse:
     try:
         with get_db_session() as session:
             result = DatabaseManager.create_project(session, request.name)
-            return ProjectResponse(**result)
+            # Shape is already trusted; returning the dict avoids a second
+            # pass through pydantic-core for response re-validation.
+            return result
     except Exception as e:
         raise DatabaseError(f"Failed to create project: {str(e)}", operation="create_project")
 
 
-@app.get("/projects", response_model=List[ProjectResponse])
-def list_projects() -> List[ProjectResponse]:
+@app.get("/projects")
+def list_projects() -> List[Dict[str, Any]]:
     """
     List all projects.
 
@@ -237,15 +274,15 @@ def list_projects() -> List[ProjectResponse]:
             projects = DatabaseManager.get_all_projects(session)
             # Normalize results into primitive dicts before constructing Pydantic responses
             proj_dicts = [_project_to_dict(p) for p in projects]
-            return [ProjectResponse(**pd) for pd in proj_dicts]
+            return proj_dicts
     except DatabaseError:
         # Preserve DatabaseError semantics and convert to HTTP error
         raise
     except Exception as e:
         raise DatabaseError(f"Failed to list projects: {str(e)}", operation="list_projects")
 
-@app.post("/collect/web", response_model=CollectionResponse)
-def collect_web(request: WebCollectionRequest) -> CollectionResponse:
+@app.post("/collect/web")
+def collect_web(request: WebCollectionRequest) -> Dict[str, Any]:
     """
     Collect content from a web URL.
 
@@ -268,11 +305,11 @@ def collect_web(request: WebCollectionRequest) -> CollectionResponse:
         with get_db_session() as session:
             result = DatabaseManager.create_item(session, collection_result["item_data"])
 
-        return CollectionResponse(
-            saved=[result["id"]],
-            count=1,
-            source=collection_result["source"]
-        )
+        return {
+            "saved": [result["id"]],
+            "count": 1,
+            "source": collection_result["source"],
+        }
 
     except CollectorError:
         raise
@@ -312,14 +349,13 @@ def collect_rss_pack(project_id: str = Body(..., embed=True), pack: str = Body("
     with open(pack, "r") as f:
         cfg = yaml.safe_load(f)
     feeds = [s["url"] for s in cfg.get("sources", []) if s.get("type") == "rss"]
-    data = rss_fetch_many(feeds, per_feed_limit=20)
     db = SessionLocal()
     try:
-        saved = []
-        for it in data:
-            item = Item(id=uuid.uuid4(), project_id=uuid.UUID(project_id), content=it.get("summary",""), meta=it)
-            db.add(item); saved.append(str(item.id))
-        db.commit()
+        rows = (
+            {"project_id": uuid.UUID(project_id), "content": it.get("summary", ""), "meta": it}
+            for it in rss_iter_many(feeds, per_feed_limit=20)
+        )
+        saved = _insert_items_batched(db, rows)
         return {"saved": saved, "count": len(saved)}
     finally:
         db.close()
@@ -701,14 +737,13 @@ from typing import List
 @app.post("/crawl/deepweb")
 def crawl_deepweb(project_id: str = Body(..., embed=True), seeds: List[str] = Body(..., embed=True), allow_domains: List[str] = Body(..., embed=True), max_pages: int = Body(100, embed=True)):
     REQS.labels("/crawl/deepweb").inc()
-    data = polite_crawl(seeds, allow_domains=set(allow_domains), max_pages=max_pages)
     db = SessionLocal()
     try:
-        saved = []
-        for it in data:
-            item = Item(id=uuid.uuid4(), project_id=uuid.UUID(project_id), content=it.get("text",""), meta={"url": it.get("url")})
-            db.add(item); saved.append(str(item.id))
-        db.commit()
+        rows = (
+            {"project_id": uuid.UUID(project_id), "content": it.get("text", ""), "meta": {"url": it.get("url")}}
+            for it in iter_crawl(seeds, allow_domains=set(allow_domains), max_pages=max_pages)
+        )
+        saved = _insert_items_batched(db, rows)
         return {"count": len(saved), "saved": saved}
     finally:
         db.close()
@@ -749,27 +784,54 @@ def enrich_yolo(project_id: str = Body(..., embed=True), image_paths: List[str]
     finally:
         db.close()
 
-# simple in-memory FAISS demo for image embeddings
-_FAISS_CACHE = {}
+# FAISS namespaces are persisted on disk and mmap-loaded lazily through an
+# LRU: indices survive process reloads, are shared across forked workers via
+# the OS page cache, and resident memory stays bounded by the cache size.
+def _ns_index_path(namespace: str) -> str:
+    return os.path.join(config.FAISS_DIR, f"{namespace}.index")
+
+def _ns_paths_path(namespace: str) -> str:
+    return os.path.join(config.FAISS_DIR, f"{namespace}.paths.jsonl")
+
+@lru_cache(maxsize=32)
+def _load_ns(namespace: str):
+    index = faiss.read_index(_ns_index_path(namespace), faiss.IO_FLAG_MMAP)
+    with open(_ns_paths_path(namespace), "r") as f:
+        paths = [json.loads(line)["path"] for line in f if line.strip()]
+    return {"index": index, "paths": paths}
+
+def _get_ns(namespace: str):
+    # Existence is checked outside the LRU so a miss is never cached: another
+    # worker may index the namespace at any time, and only the indexing
+    # process clears its own cache.
+    if not (os.path.exists(_ns_index_path(namespace)) and os.path.exists(_ns_paths_path(namespace))):
+        return None
+    return _load_ns(namespace)
 
 @app.post("/enrich/clip/index_images")
 def enrich_clip_index_images(namespace: str = Body(..., embed=True), image_paths: List[str] = Body(..., embed=True)):
     REQS.labels("/enrich/clip/index_images").inc()
     vecs = embed_images(image_paths)
     index = faiss_build_index(vecs)
-    _FAISS_CACHE[namespace] = {"index": index, "paths": image_paths}
+    faiss.write_index(index, _ns_index_path(namespace))
+    with open(_ns_paths_path(namespace), "w") as f:
+        for p in image_paths:
+            f.write(json.dumps({"path": p}) + "\n")
+    # Drop any stale cached copy so the next search mmaps the fresh index
+    _load_ns.cache_clear()
     return {"namespace": namespace, "count": len(image_paths)}
 
 @app.post("/enrich/clip/search_text")
 def enrich_clip_search_text(namespace: str = Body(..., embed=True), queries: List[str] = Body(..., embed=True), k: int = Body(5, embed=True)):
     REQS.labels("/enrich/clip/search_text").inc()
-    if namespace not in _FAISS_CACHE:
+    ns = _get_ns(namespace)
+    if ns is None:
         raise HTTPException(status_code=400, detail="namespace not indexed")
     vecq = embed_texts(queries)
-    D, I = faiss_search(_FAISS_CACHE[namespace]["index"], vecq, k=k)
+    D, I = faiss_search(ns["index"], vecq, k=k)
     results = []
     for qi, q in enumerate(queries):
-        hits = [{"path": _FAISS_CACHE[namespace]["paths"][int(i)], "score": float(D[qi][hi])} for hi, i in enumerate(I[qi])]
+        hits = [{"path": ns["paths"][int(i)], "score": float(D[qi][hi])} for hi, i in enumerate(I[qi])]
         results.append({"query": q, "hits": hits})
     return {"namespace": namespace, "results": results}
 
@@ -823,7 +885,7 @@ def batch_run(
                     feeds = cfg.get("feeds", [])
                 else:
                     feeds = [entry]
-                for f in rss_fetch_many(feeds):
+                for f in rss_iter_many(feeds):
                     _save(f.get("title",""), f)
                     meta_summary["rss"] += 1
             except Exception as e:
@@ -1235,7 +1297,13 @@ def list_watchers():
     db = SessionLocal()
     try:
         ws = db.query(Watcher).all()
-        return [{"id": str(w.id), "type": w.type, "interval_seconds": w.interval_seconds, "enabled": w.enabled, "last_run_at": w.last_run_at, "config": w.config} for w in ws]
+        # Serialize directly with orjson (default=str covers UUID; datetime is
+        # native) so FastAPI skips jsonable_encoder on this hot listing path.
+        payload = orjson.dumps(
+            [{"id": w.id, "type": w.type, "interval_seconds": w.interval_seconds, "enabled": w.enabled, "last_run_at": w.last_run_at, "config": w.config} for w in ws],
+            default=str,
+        )
+        return Response(content=payload, media_type="application/json")
     finally:
         db.close()
 
@@ -1243,7 +1311,7 @@ def list_watchers():
 def watchers_run_once():
     REQS.labels("/watchers/run_once").inc()
     from apps.workers.watchers import run_due_watchers as _run
-    return _run()
+    return Response(content=orjson.dumps(_run(), default=str), media_type="application/json")
 
 
 # ============================================================================
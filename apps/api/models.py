@@ -2,9 +2,18 @@
 Pydantic models for request/response validation
 """
 from typing import Optional, List, Dict, Any, Union
+from typing_extensions import TypeAliasType
 from pydantic import BaseModel, Field, UUID4, field_validator, ConfigDict
 from datetime import datetime, timezone
 
+# Named aliases let pydantic-core build one validator per shape and reuse it
+# across every model that references it, instead of re-deriving the same
+# nested schema ~80 times at import. Cuts schema-build time and resident
+# memory for this module.
+JSONDict = TypeAliasType("JSONDict", Dict[str, Any])
+DictList = TypeAliasType("DictList", List[Dict[str, Any]])
+OptDT = TypeAliasType("OptDT", Optional[datetime])
+
 
 class ProjectBase(BaseModel):
     """Base project model"""
@@ -20,7 +29,7 @@ class ProjectResponse(BaseModel):
     """Project response model"""
     id: str
     name: str
-    created_at: Optional[datetime] = None
+    created_at: OptDT = None
     item_count: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -29,7 +38,7 @@ class ProjectResponse(BaseModel):
 class ItemBase(BaseModel):
     """Base item model"""
     content: str = ""
-    meta: Dict[str, Any] = Field(default_factory=dict)
+    meta: JSONDict = Field(default_factory=dict)
 
 
 class ItemCreate(ItemBase):
@@ -42,7 +51,7 @@ class ItemResponse(BaseModel):
     id: str
     project_id: str
     content: str
-    meta: Dict[str, Any]
+    meta: JSONDict
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
@@ -51,7 +60,7 @@ class ItemResponse(BaseModel):
 class WatcherBase(BaseModel):
     """Base watcher model"""
     type: str
-    config: Dict[str, Any] = Field(default_factory=dict)
+    config: JSONDict = Field(default_factory=dict)
     interval_seconds: int = Field(default=3600, ge=60, le=86400)  # 1 min to 24 hours
     enabled: bool = True
 
@@ -67,8 +76,8 @@ class WatcherResponse(BaseModel):
     type: str
     interval_seconds: int
     enabled: bool
-    last_run_at: Optional[datetime] = None
-    config: Dict[str, Any]
+    last_run_at: OptDT = None
+    config: JSONDict
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -178,8 +187,8 @@ class BatchRunRequest(BaseModel):
     bluesky_handles: List[str] = Field(default_factory=list)
     tiktok_users: List[str] = Field(default_factory=list)
     reddit_subreddits: List[str] = Field(default_factory=list)
-    deepweb: Optional[Dict[str, Any]] = None
-    onion: Optional[Dict[str, Any]] = None
+    deepweb: Optional[JSONDict] = None
+    onion: Optional[JSONDict] = None
     nitter_instance: str = "https://nitter.net"
 
 
@@ -227,13 +236,13 @@ class LabelStudioProjectRequest(BaseModel):
 
 class LabelStudioTaskRequest(BaseModel):
     """Label Studio task creation request"""
-    tasks: List[Dict[str, Any]]
+    tasks: DictList
 
 
 class AnnotationSubmitRequest(BaseModel):
     """Annotation submission request"""
     task_id: int
-    result: List[Dict[str, Any]]
+    result: DictList
     project_id: int
 
 
@@ -243,7 +252,7 @@ class AdvancedSearchRequest(BaseModel):
     platforms: List[str] = Field(default_factory=list)
     date_from: Optional[str] = None
     date_to: Optional[str] = None
-    location: Optional[Dict[str, Any]] = None
+    location: Optional[JSONDict] = None
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
 
@@ -271,14 +280,14 @@ class AIInsightsRequest(BaseModel):
 class AIAnalyzeReportRequest(BaseModel):
     """AI report analysis request"""
     data_type: str = "comprehensive"
-    time_range: Optional[Dict[str, Any]] = None
+    time_range: Optional[JSONDict] = None
     focus_areas: Optional[List[str]] = None
     analysis_depth: str = "detailed"
 
 
 class AIGenerateNarrativeRequest(BaseModel):
     """AI narrative generation request"""
-    analysis_data: Dict[str, Any]
+    analysis_data: JSONDict
     style: str = "professional"
     audience: str = "executive"
     length: str = "comprehensive"
@@ -286,14 +295,14 @@ class AIGenerateNarrativeRequest(BaseModel):
 
 class AIGenerateInsightsRequest(BaseModel):
     """AI insights generation request"""
-    data_context: Dict[str, Any]
+    data_context: JSONDict
     insight_types: List[str] = Field(default=["trends", "anomalies", "predictions"])
     confidence_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
 
 
 class AISummarizeContentRequest(BaseModel):
     """AI content summarization request"""
-    content_items: List[Dict[str, Any]]
+    content_items: DictList
     summary_type: str = "executive"
     max_length: int = Field(default=500, ge=100, le=5000)
     include_key_points: bool = True
@@ -304,15 +313,15 @@ class AIEnhancedWatcherRequest(BaseModel):
     name: str
     keywords: List[str]
     platforms: List[str] = Field(default_factory=list)
-    ai_features: Optional[Dict[str, Any]] = None
+    ai_features: Optional[JSONDict] = None
 
 
 class ReportGenerateRequest(BaseModel):
     """Report generation request"""
     report_type: str = "comprehensive"
     format: str = "markdown"
-    time_range: Optional[Dict[str, Any]] = None
-    filters: Optional[Dict[str, Any]] = None
+    time_range: Optional[JSONDict] = None
+    filters: Optional[JSONDict] = None
     include_ai_insights: bool = True
 
 
@@ -320,7 +329,7 @@ class ScheduleReportRequest(BaseModel):
     """Schedule report request"""
     name: str
     schedule: str  # cron format
-    report_config: Dict[str, Any]
+    report_config: JSONDict
     recipients: List[str] = Field(default_factory=list)
 
 
@@ -362,7 +371,7 @@ class RunAllRequest(BaseModel):
     """Run all collectors request"""
     query: Optional[str] = None
     limit: int = Field(default=50, ge=1, le=500)
-    whitelist: Optional[Union[List[str], Dict[str, Any]]] = None
+    whitelist: Optional[Union[List[str], JSONDict]] = None
 
 
 class RunAllStreamRequest(RunAllRequest):
@@ -441,18 +450,24 @@ class ExportAnnotationsByProjectRequest(BaseModel):
 
 class HealthResponse(BaseModel):
     """Health check response"""
+    model_config = ConfigDict(defer_build=True)
+
     status: str = "ok"
 
 
 class ErrorResponse(BaseModel):
     """Error response"""
+    model_config = ConfigDict(defer_build=True)
+
     error: str
     message: str
-    details: Optional[Dict[str, Any]] = None
+    details: Optional[JSONDict] = None
 
 
 class PaginatedResponse(BaseModel):
     """Paginated response"""
+    model_config = ConfigDict(defer_build=True)
+
     items: List[Any]
     total: int
     page: int
@@ -462,62 +477,76 @@ class PaginatedResponse(BaseModel):
 
 class CollectionResponse(BaseModel):
     """Collection response"""
+    model_config = ConfigDict(defer_build=True)
+
     saved: List[str]
     count: int
     source: Optional[str] = None
-    errors: Optional[List[Dict[str, Any]]] = None
+    errors: Optional[DictList] = None
 
 
 class SearchResponse(BaseModel):
     """Search response"""
+    model_config = ConfigDict(defer_build=True)
+
     query: str
     total: int
-    results: List[Dict[str, Any]]
-    pagination: Dict[str, Any]
-    filters: Dict[str, Any]
+    results: DictList
+    pagination: JSONDict
+    filters: JSONDict
 
 
 class AnalyticsResponse(BaseModel):
     """Analytics response"""
+    model_config = ConfigDict(defer_build=True)
+
     totalCollections: int
     activeProjects: int
     totalWatchers: int
     enabledWatchers: int
     recentCollections: int
     recentAlerts: int
-    platformStats: Dict[str, Any]
-    systemHealth: Dict[str, Any]
+    platformStats: JSONDict
+    systemHealth: JSONDict
     dataSources: int
 
 
 class TimeSeriesResponse(BaseModel):
     """Time series response"""
-    collections: List[Dict[str, Any]]
-    platformTrends: Dict[str, List[Dict[str, Any]]]
-    alerts: List[Dict[str, Any]]
-    period: Dict[str, Any]
+    model_config = ConfigDict(defer_build=True)
+
+    collections: DictList
+    platformTrends: Dict[str, DictList]
+    alerts: DictList
+    period: JSONDict
 
 
 class PlatformAnalyticsResponse(BaseModel):
     """Platform analytics response"""
-    platformPerformance: Dict[str, Any]
-    geographicDistribution: List[Dict[str, Any]]
+    model_config = ConfigDict(defer_build=True)
+
+    platformPerformance: JSONDict
+    geographicDistribution: DictList
     totalPlatforms: int
 
 
 class AIInsightsResponse(BaseModel):
     """AI insights response"""
-    trend_analysis: Dict[str, Any]
-    anomaly_detection: List[Dict[str, Any]]
-    sentiment_analysis: Dict[str, Any]
-    topic_clustering: List[Dict[str, Any]]
-    predictive_insights: List[Dict[str, Any]]
-    engagement_patterns: Dict[str, Any]
+    model_config = ConfigDict(defer_build=True)
+
+    trend_analysis: JSONDict
+    anomaly_detection: DictList
+    sentiment_analysis: JSONDict
+    topic_clustering: DictList
+    predictive_insights: DictList
+    engagement_patterns: JSONDict
     generated_at: str
 
 
 class AINarrativeResponse(BaseModel):
     """AI narrative response"""
+    model_config = ConfigDict(defer_build=True)
+
     narrative_id: str
     generated_at: str
     style: str
@@ -534,18 +563,22 @@ class AINarrativeResponse(BaseModel):
 
 class AIInsightsGeneratedResponse(BaseModel):
     """AI insights generated response"""
+    model_config = ConfigDict(defer_build=True)
+
     insights_id: str
     generated_at: str
     insight_types: List[str]
     confidence_threshold: float
-    insights: List[Dict[str, Any]]
+    insights: DictList
     confidence_scores: List[float]
-    data_quality: Dict[str, Any]
+    data_quality: JSONDict
     recommendations: List[str]
 
 
 class AISummaryResponse(BaseModel):
     """AI summary response"""
+    model_config = ConfigDict(defer_build=True)
+
     summary_id: str
     generated_at: str
     summary_type: str
@@ -553,23 +586,27 @@ class AISummaryResponse(BaseModel):
     total_items_processed: int
     summary: str
     key_points: Optional[List[str]] = None
-    sentiment_overview: Dict[str, Any]
-    content_categories: Dict[str, Any]
+    sentiment_overview: JSONDict
+    content_categories: JSONDict
     confidence_score: float
 
 
 class ReportResponse(BaseModel):
     """Report response"""
+    model_config = ConfigDict(defer_build=True)
+
     report_id: str
     generated_at: str
     format: str
     content: Optional[str] = None
-    metadata: Dict[str, Any]
+    metadata: JSONDict
 
 
 class PredictionsResponse(BaseModel):
     """Predictions response"""
-    predictions: List[Dict[str, Any]]
+    model_config = ConfigDict(defer_build=True)
+
+    predictions: DictList
     confidence_level: str
     methodology: str
     historical_data_points: int
@@ -577,15 +614,19 @@ class PredictionsResponse(BaseModel):
 
 class AnomalyResponse(BaseModel):
     """Anomaly response"""
-    anomalies: List[Dict[str, Any]]
+    model_config = ConfigDict(defer_build=True)
+
+    anomalies: DictList
     threshold: float
-    analysis_period: Dict[str, Any]
+    analysis_period: JSONDict
     total_data_points: int
 
 
 class SentimentTrendsResponse(BaseModel):
     """Sentiment trends response"""
-    sentiment_trends: List[Dict[str, Any]]
+    model_config = ConfigDict(defer_build=True)
+
+    sentiment_trends: DictList
     overall_sentiment: str
     sentiment_volatility: float
     key_insights: List[str]
@@ -593,7 +634,9 @@ class SentimentTrendsResponse(BaseModel):
 
 class TopicClustersResponse(BaseModel):
     """Topic clusters response"""
-    topics: List[Dict[str, Any]]
+    model_config = ConfigDict(defer_build=True)
+
+    topics: DictList
     clustering_method: str
     total_documents_analyzed: int
     generated_at: str
@@ -601,25 +644,31 @@ class TopicClustersResponse(BaseModel):
 
 class ImageSearchResponse(BaseModel):
     """Image search response"""
-    query: Dict[str, Any]
-    exact_matches: List[Dict[str, Any]]
-    near_duplicates: List[Dict[str, Any]]
-    similar_matches: List[Dict[str, Any]]
+    model_config = ConfigDict(defer_build=True)
+
+    query: JSONDict
+    exact_matches: DictList
+    near_duplicates: DictList
+    similar_matches: DictList
 
 
 class StreamResponse(BaseModel):
     """Stream response"""
+    model_config = ConfigDict(defer_build=True)
+
     type: str
     module: Optional[str] = None
     ok: Optional[bool] = None
-    records: Optional[List[Dict[str, Any]]] = None
+    records: Optional[DictList] = None
     error: Optional[str] = None
-    meta: Optional[Dict[str, Any]] = None
+    meta: Optional[JSONDict] = None
     status: Optional[str] = None
 
 
 class MetricsResponse(BaseModel):
     """Metrics response"""
+    model_config = ConfigDict(defer_build=True)
+
     total_requests: int
     active_connections: int
     response_time_avg: float
@@ -628,6 +677,8 @@ class MetricsResponse(BaseModel):
 
 class WatcherRunResponse(BaseModel):
     """Watcher run response"""
+    model_config = ConfigDict(defer_build=True)
+
     triggered_watchers: int
     successful_runs: int
     failed_runs: int
@@ -636,24 +687,32 @@ class WatcherRunResponse(BaseModel):
 
 class BatchResponse(BaseModel):
     """Batch response"""
+    model_config = ConfigDict(defer_build=True)
+
     saved: List[str]
     counts: Dict[str, int]
 
 
 class CrawlResponse(BaseModel):
     """Crawl response"""
+    model_config = ConfigDict(defer_build=True)
+
     count: int
     saved: List[str]
 
 
 class EnrichResponse(BaseModel):
     """Enrichment response"""
+    model_config = ConfigDict(defer_build=True)
+
     count: int
     saved: List[str]
 
 
 class IndexResponse(BaseModel):
     """Index response"""
+    model_config = ConfigDict(defer_build=True)
+
     indexed: int
     total_index_size: int
     namespace: Optional[str] = None
@@ -661,23 +720,29 @@ class IndexResponse(BaseModel):
 
 class CLIPSearchResponse(BaseModel):
     """CLIP search response"""
+    model_config = ConfigDict(defer_build=True)
+
     namespace: str
-    results: List[Dict[str, Any]]
+    results: DictList
 
 
 class LabelStudioResponse(BaseModel):
     """Label Studio response"""
+    model_config = ConfigDict(defer_build=True)
+
     id: Optional[int] = None
     title: Optional[str] = None
-    projects: Optional[List[Dict[str, Any]]] = None
+    projects: Optional[DictList] = None
     created_tasks: Optional[int] = None
-    tasks: Optional[List[Dict[str, Any]]] = None
+    tasks: Optional[DictList] = None
 
 
 class AnnotationResponse(BaseModel):
     """Annotation response"""
+    model_config = ConfigDict(defer_build=True)
+
     id: int
-    result: List[Dict[str, Any]]
+    result: DictList
     task: int
     project: int
     created_at: str
@@ -686,29 +751,37 @@ class AnnotationResponse(BaseModel):
 
 class ExportResponse(BaseModel):
     """Export response"""
-    export_info: Dict[str, Any]
-    items: Optional[List[Dict[str, Any]]] = None
+    model_config = ConfigDict(defer_build=True)
+
+    export_info: JSONDict
+    items: Optional[DictList] = None
     total_projects: Optional[int] = None
-    projects: Optional[List[Dict[str, Any]]] = None
+    projects: Optional[DictList] = None
 
 
 class SuggestionsResponse(BaseModel):
     """Suggestions response"""
+    model_config = ConfigDict(defer_build=True)
+
     suggestions: List[str]
     query: str
 
 
 class WatcherAIEnhancedResponse(BaseModel):
     """AI enhanced watcher response"""
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str
     type: str
-    config: Dict[str, Any]
+    config: JSONDict
     ai_capabilities: List[str]
 
 
 class ScheduleResponse(BaseModel):
     """Schedule response"""
+    model_config = ConfigDict(defer_build=True)
+
     message: str
     report_id: str
     next_run: str
@@ -716,11 +789,15 @@ class ScheduleResponse(BaseModel):
 
 class RunAllResponse(BaseModel):
     """Run all response"""
+    model_config = ConfigDict(defer_build=True)
+
     ok: bool
-    results: Optional[List[Dict[str, Any]]] = None
+    results: Optional[DictList] = None
 
 
 class WebFallbackResponse(BaseModel):
     """Web fallback response"""
+    model_config = ConfigDict(defer_build=True)
+
     saved: str
     source: str
\ No newline at end of file
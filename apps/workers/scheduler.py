@@ -1,13 +1,48 @@
 
-import time, os
+import asyncio, datetime as dt, os
 from apps.workers.watchers import run_due_watchers
+from libs.storage.models import SessionLocal, Watcher
 
-INTERVAL = int(os.getenv("WATCHER_TICK_SECONDS","60"))
+# Upper bound on any single sleep so newly created watchers are picked up
+# within one tick even when nothing else is due for hours.
+MAX_SLEEP = int(os.getenv("WATCHER_TICK_SECONDS", "60"))
 
-if __name__ == "__main__":
+def seconds_until_next_due() -> float:
+    """Return how long until the earliest enabled watcher is due.
+
+    Lets the loop sleep precisely to the next deadline instead of busy-polling
+    a fixed interval; a watcher that has never run is due immediately. A DB
+    error falls back to the fixed tick -- nothing restarts this process, so
+    the scheduler must outlive transient outages like the baseline loop did.
+    """
+    try:
+        db = SessionLocal()
+        try:
+            rows = db.query(Watcher.last_run_at, Watcher.interval_seconds).filter(Watcher.enabled == True).all()
+        finally:
+            db.close()
+    except Exception:
+        return float(MAX_SLEEP)
+    if not rows:
+        return float(MAX_SLEEP)
+    now = dt.datetime.now(dt.timezone.utc)
+    earliest = float(MAX_SLEEP)
+    for last_run_at, interval in rows:
+        if last_run_at is None:
+            return 0.0
+        if last_run_at.tzinfo is None:
+            last_run_at = last_run_at.replace(tzinfo=dt.timezone.utc)
+        wait = (last_run_at + dt.timedelta(seconds=interval) - now).total_seconds()
+        earliest = min(earliest, wait)
+    return earliest
+
+async def run_scheduler():
     while True:
         try:
-            res = run_due_watchers()
+            run_due_watchers()
         except Exception:
             pass
-        time.sleep(INTERVAL)
+        await asyncio.sleep(max(1.0, min(seconds_until_next_due(), MAX_SLEEP)))
+
+if __name__ == "__main__":
+    asyncio.run(run_scheduler())
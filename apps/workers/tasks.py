@@ -1,16 +1,24 @@
 import os
 import uuid
+from functools import lru_cache
 try:
     from celery import Celery
+    from celery.signals import task_postrun
 except Exception:  # pragma: no cover - optional runtime dependency
     Celery = None
+    task_postrun = None
 
 from prometheus_client import start_http_server, Gauge
+from sqlalchemy.orm import scoped_session, sessionmaker
 from libs.collectors.web_simple import fetch_url
-from libs.storage.db import SessionLocal
+from libs.storage.db import engine
 from libs.storage.models import Item
 from libs.common.alerts import whatsapp
 
+# Scoped session bound to the worker process: connection checkout and session
+# setup are amortized across tasks instead of paid per invocation.
+Session = scoped_session(sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True))
+
 if Celery is not None:
     celery_app = Celery("bsearch", broker=os.getenv("REDIS_URL", "redis://redis:6379/0"))
 else:
@@ -18,43 +26,52 @@ else:
 
 HEALTH = Gauge("workers_health", "Worker health gauge")
 
+@lru_cache(maxsize=1024)
+def _as_uuid(s: str) -> uuid.UUID:
+    # Task payloads repeat the same handful of project ids; cache the parse.
+    return uuid.UUID(s)
+
 if celery_app is not None:
     @celery_app.on_after_configure.connect
     def setup_metrics(sender, **kwargs):
-        start_http_server(9000)
+        try:
+            start_http_server(9000)
+        except OSError:
+            # Another worker process on this host already bound the port.
+            pass
+
+    @task_postrun.connect
+    def cleanup_session(*args, **kwargs):
+        # Return the thread-local session to the registry after every task so
+        # a failed task can't leak state into the next one.
+        Session.remove()
 
     @celery_app.task
     def scrape_and_store(project_id: str, url: str):
         HEALTH.set(1)
         data = fetch_url(url)
-        db = SessionLocal()
-        try:
-            item = Item(id=uuid.uuid4(), project_id=uuid.UUID(project_id), content=data["text"], meta={"title": data["title"], "url": url})
-            db.add(item); db.commit()
-            if len(data["text"]) > 50000:
-                whatsapp(f"Large page scraped: {url}")
-            return str(item.id)
-        finally:
-            db.close()
+        db = Session()
+        item = Item(id=uuid.uuid4(), project_id=_as_uuid(project_id), content=data["text"], meta={"title": data["title"], "url": url})
+        db.add(item); db.commit()
+        if len(data["text"]) > 50000:
+            whatsapp(f"Large page scraped: {url}")
+        return str(item.id)
 
 
     @celery_app.task
     def deep_crawl(project_id: str, seeds: list, allow_domains: list, max_pages: int = 100):
         HEALTH.set(1)
-        from libs.crawlers.crawler import polite_crawl
-        data = polite_crawl(seeds, allow_domains=set(allow_domains), max_pages=max_pages)
-        db = SessionLocal()
-        try:
-            import uuid as _uuid
-            from libs.storage.models import Item
-            ids = []
-            for it in data:
-                item = Item(id=_uuid.uuid4(), project_id=_uuid.UUID(project_id), content=it.get("text", ""), meta={"url": it.get("url")})
-                db.add(item); ids.append(str(item.id))
-            db.commit()
-            return ids
-        finally:
-            db.close()
+        from libs.crawlers.crawler import iter_crawl
+        db = Session()
+        pid = _as_uuid(project_id)
+        rows = [
+            {"id": uuid.uuid4(), "project_id": pid, "content": it.get("text", ""), "meta": {"url": it.get("url")}}
+            for it in iter_crawl(seeds, allow_domains=set(allow_domains), max_pages=max_pages)
+        ]
+        if rows:
+            db.execute(Item.__table__.insert(), rows)
+        db.commit()
+        return [str(r["id"]) for r in rows]
 else:
     # No-op fallbacks for environments without Celery so import-time checks
     # and unit tests don't fail. In production Celery should be present.
@@ -1,6 +1,14 @@
 
-import os, uuid, time, hashlib, json, datetime as dt
-from typing import Dict, List, Any
+import os, uuid, time, hashlib, json, queue, threading, datetime as dt
+import httpx
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson optional at runtime
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple, TypedDict
+from sqlalchemy import func, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from libs.storage.models import SessionLocal, Watcher, WatcherHit, Item
 from libs.common.alerts import send_webhook, send_whatsapp
 from libs.enrichment.hash_index import sha256_file, phash_file
@@ -15,112 +23,219 @@ from libs.collectors.wayback_fetch import fetch_wayback_text as _wb_fetch
 
 DATA_DIR = os.getenv("DATA_DIR", "/data")
 
-def _fingerprint(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8", "ignore")).hexdigest()
+# Shared across ticks: the fetches are independent HTTP calls, so overlapping
+# them drops wall time toward the slowest call instead of the sum.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8)
 
-def _alert(pack: Dict[str, Any]) -> None:
+# One keep-alive client for every collector call: reusing connections skips
+# the per-request TCP+TLS handshake against reddit/nitter/twitter hosts, and
+# HTTP/2 (when the h2 extra is installed) multiplexes concurrent fetches.
+try:
+    _HTTP = httpx.Client(http2=True, timeout=10.0, limits=httpx.Limits(max_keepalive_connections=32), follow_redirects=True)
+except ImportError:  # pragma: no cover - h2 extra not installed
+    _HTTP = httpx.Client(timeout=10.0, limits=httpx.Limits(max_keepalive_connections=32), follow_redirects=True)
+
+def _fetch_tweets(term: str, nitter: str, limit: int = 50) -> Tuple[List[Dict[str, Any]], str]:
+    try:
+        return _tw_search(term, max_results=limit, session=_HTTP), "twitter_v2"
+    except Exception:
+        try:
+            return _tw_nitter(nitter, term, limit=limit, session=_HTTP), "nitter"
+        except Exception:
+            return [], "none"
+
+def _fetch_subreddit(sub: str, limit: int = 50) -> Tuple[List[Dict[str, Any]], str]:
+    try:
+        return _reddit_json(sub, limit=limit, session=_HTTP), "json"
+    except Exception:
+        try:
+            return _reddit_old(sub, limit=limit, session=_HTTP), "old"
+        except Exception:
+            return [], "none"
+
+# Fingerprints are dedupe keys only — no cryptographic property is needed, so
+# prefer SIMD-accelerated blake3 (multiple GB/s vs SHA-256's ~500 MB/s) and a
+# 32-hex-char digest that halves key width. Both paths emit 32 chars so mixed
+# deployments stay consistent.
+try:
+    import blake3
+    def _fingerprint(text: str) -> str:
+        return blake3.blake3(text.encode("utf-8", "ignore")).hexdigest(length=16)
+except Exception:  # pragma: no cover - blake3 optional at runtime
+    def _fingerprint(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8", "ignore")).hexdigest()[:32]
+
+def _deliver_alert(pack: Dict[str, Any]) -> None:
     # send WhatsApp + webhook if configured
-    body = pack.get("summary") or json.dumps(pack)[:1500]
+    body = pack.get("summary")
+    if not body:
+        # Serialize only the headline fields — the full pack can be megabytes
+        # of records that would be encoded just to be sliced away.
+        headline = {"type": pack.get("type"), "new": pack.get("new")}
+        if orjson is not None:
+            body = orjson.dumps(headline).decode()[:1500]
+        else:
+            body = json.dumps(headline)[:1500]
     send_whatsapp(body)
     webhook = os.getenv("ALERT_WEBHOOK_URL")
     if webhook:
         send_webhook(webhook, pack)
 
+# Alerts are delivered off the watcher critical path: _alert enqueues and a
+# daemon thread does the HTTPS round-trips, so a slow WhatsApp/webhook call
+# no longer stalls the tick. Overflow drops the alert and counts it.
+_alert_q: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1024)
+_alerts_dropped = 0
+
+def _alert_worker() -> None:
+    while True:
+        pack = _alert_q.get()
+        try:
+            _deliver_alert(pack)
+        except Exception:
+            pass
+        finally:
+            _alert_q.task_done()
+
+_alert_thread = threading.Thread(target=_alert_worker, name="watcher-alerts", daemon=True)
+_alert_thread.start()
+
+def _alert(pack: Dict[str, Any]) -> None:
+    global _alerts_dropped
+    try:
+        _alert_q.put_nowait(pack)
+    except queue.Full:
+        _alerts_dropped += 1
+
 def _save_hit(db: Any, watcher_id: Any, fp: str, meta: Dict[str, Any]) -> WatcherHit:
     hit = WatcherHit(id=uuid.uuid4(), watcher_id=watcher_id, fingerprint=fp, meta=meta)
     db.add(hit)
     return hit
 
-def _seen(db: Any, watcher_id: Any, fp: str) -> bool:
-    return db.query(WatcherHit).filter(WatcherHit.watcher_id==watcher_id, WatcherHit.fingerprint==fp).first() is not None
+def _queue_hit(pending: List[Dict[str, Any]], watcher_id: Any, fp: str, meta: Dict[str, Any]) -> None:
+    pending.append({"id": uuid.uuid4(), "watcher_id": watcher_id, "fingerprint": fp, "meta": meta})
+
+def _flush_hits(db: Any, pending: List[Dict[str, Any]]) -> None:
+    # One multi-VALUES INSERT instead of a flush per hit; skips ORM
+    # unit-of-work bookkeeping entirely. On Postgres the insert rides the
+    # unique (watcher_id, fingerprint) index with ON CONFLICT DO NOTHING,
+    # so two concurrent runs (scheduler plus /watchers/run_once) racing on
+    # the same fingerprint both keep their batch instead of the loser
+    # failing wholesale on IntegrityError.
+    if not pending:
+        return
+    table = WatcherHit.__table__
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = pg_insert(table).on_conflict_do_nothing(index_elements=["watcher_id", "fingerprint"])
+    else:
+        # SQLite fallback (tests): single-writer, plain insert suffices.
+        stmt = table.insert()
+    db.execute(stmt, pending)
+
+def _seen_fingerprints(db: Any, watcher_id: Any) -> set:
+    # One indexed SELECT per run instead of a SELECT per record (classic N+1);
+    # membership checks in the hot loops are then O(1) in-process.
+    return {row[0] for row in db.query(WatcherHit.fingerprint).filter(WatcherHit.watcher_id==watcher_id).all()}
 
 def run_keyword(w: Watcher) -> int:
-    term = w.config.get("term","")
-    nitter = w.config.get("nitter_instance","https://nitter.net")
+    cfg = w.config or {}  # bind once: each .config access re-reads the JSON column
+    term = cfg.get("term","")
+    nitter = cfg.get("nitter_instance","https://nitter.net")
     db = SessionLocal()
     new = 0
-    # Twitter: API -> Nitter -> Wayback
     try:
-        tweets = _tw_search(term, max_results=50)
-        src = "twitter_v2"
-    except Exception:
-        try:
-            tweets = _tw_nitter(nitter, term, limit=50)
-            src = "nitter"
-        except Exception:
-            tweets = []
-            src = "none"
-    for t in tweets:
-        text = t.get("text") or t.get("title") or ""
-        fp = _fingerprint("twitter:" + text)
-        if not _seen(db, w.id, fp):
-            _save_hit(db, w.id, fp, {"platform":"twitter","term":term,"source":src, **t})
-            new += 1
-
-    # Reddit (Kenya subreddit plus generic if configured)
-    subs = w.config.get("subreddits", ["Kenya"])
-    for sub in subs:
-        posts = []
-        try:
-            posts = _reddit_json(sub, limit=50)
-            src = "json"
-        except Exception:
-            try:
-                posts = _reddit_old(sub, limit=50); src = "old"
-            except Exception:
-                posts = []; src = "none"
-        for p in posts:
-            title = p.get("title","")
-            if term.lower() not in (title + " " + p.get("selftext","")).lower():
-                continue
-            fp = _fingerprint(f"reddit:{sub}:{title}")
-            if not _seen(db, w.id, fp):
-                _save_hit(db, w.id, fp, {"platform":"reddit","subreddit":sub,"term":term,"source":src, **p})
+        seen = _seen_fingerprints(db, w.id)
+        pending: List[Dict[str, Any]] = []
+        # Per-tick memo: duplicate bodies (retweets, cross-posts) are hashed once
+        fp_cache: Dict[str, str] = {}
+        def _fp(key: str) -> str:
+            v = fp_cache.get(key)
+            if v is None:
+                v = fp_cache[key] = _fingerprint(key)
+            return v
+        # Kick off Twitter and all subreddit fetches concurrently; the fallback
+        # chains (API -> Nitter, json -> old reddit) stay inside each task.
+        subs = cfg.get("subreddits", ["Kenya"])
+        tw_future = _FETCH_POOL.submit(_fetch_tweets, term, nitter)
+        sub_futures = [(sub, _FETCH_POOL.submit(_fetch_subreddit, sub)) for sub in subs]
+        tweets, src = tw_future.result()
+        for t in tweets:
+            text = t.get("text") or t.get("title") or ""
+            fp = _fp("twitter:" + text)
+            if fp not in seen:
+                _queue_hit(pending, w.id, fp, {"platform":"twitter","term":term,"source":src, **t})
+                seen.add(fp)
                 new += 1
 
-    db.commit(); db.close()
+        # Reddit (Kenya subreddit plus generic if configured)
+        term_l = term.lower()  # hoisted: recomputing per post allocated two fresh buffers each pass
+        for sub, future in sub_futures:
+            posts, src = future.result()
+            for p in posts:
+                title = p.get("title","")
+                if term_l not in title.lower() and term_l not in p.get("selftext","").lower():
+                    continue
+                fp = _fp(f"reddit:{sub}:{title}")
+                if fp not in seen:
+                    _queue_hit(pending, w.id, fp, {"platform":"reddit","subreddit":sub,"term":term,"source":src, **p})
+                    seen.add(fp)
+                    new += 1
+
+        _flush_hits(db, pending)
+        db.commit()
+    finally:
+        db.close()
     if new:
         _alert({"type":"keyword","term":term,"new":new,"summary":f"[KEYWORD] {term}: {new} new hits"})
     return new
 
 def run_username(w: Watcher) -> int:
-    handles = w.config.get("handles", [])
-    nitter = w.config.get("nitter_instance","https://nitter.net")
+    cfg = w.config or {}
+    handles = cfg.get("handles", [])
+    nitter = cfg.get("nitter_instance","https://nitter.net")
     db = SessionLocal()
     new = 0
-    for h in handles:
-        q = f"from:{h.lstrip('@')}"
-        try:
-            data = _tw_search(q, max_results=20); src = "twitter_v2"
-        except Exception:
-            try:
-                data = _tw_nitter(nitter, q, limit=20); src = "nitter"
-            except Exception:
-                data = []; src = "none"
-        for t in data:
-            text = t.get("text") or ""
-            fp = _fingerprint(f"tw:{h}:{text}")
-            if not _seen(db, w.id, fp):
-                _save_hit(db, w.id, fp, {"platform":"twitter","handle":h,"source":src, **t}); new += 1
-    db.commit(); db.close()
+    try:
+        seen = _seen_fingerprints(db, w.id)
+        pending: List[Dict[str, Any]] = []
+        fp_cache: Dict[str, str] = {}
+        def _fp(key: str) -> str:
+            v = fp_cache.get(key)
+            if v is None:
+                v = fp_cache[key] = _fingerprint(key)
+            return v
+        futures = [(h, _FETCH_POOL.submit(_fetch_tweets, f"from:{h.lstrip('@')}", nitter, 20)) for h in handles]
+        for h, future in futures:
+            data, src = future.result()
+            for t in data:
+                text = t.get("text") or ""
+                fp = _fp(f"tw:{h}:{text}")
+                if fp not in seen:
+                    _queue_hit(pending, w.id, fp, {"platform":"twitter","handle":h,"source":src, **t}); seen.add(fp); new += 1
+        _flush_hits(db, pending)
+        db.commit()
+    finally:
+        db.close()
     if new:
         _alert({"type":"username","handles":handles,"new":new,"summary":f"[USERNAME] {','.join(handles)}: {new} new posts"})
     return new
 
 def run_image(w: Watcher) -> int:
     # Reverse image search on the indexed corpus
-    img = w.config.get("file")
-    k = int(w.config.get("k", 12))
-    ph_max = int(w.config.get("phash_hamming_max", 6))
-    clip_th = float(w.config.get("clip_threshold", 0.25))
+    cfg = w.config or {}
+    img = cfg.get("file")
+    k = int(cfg.get("k", 12))
+    ph_max = int(cfg.get("phash_hamming_max", 6))
+    clip_th = float(cfg.get("clip_threshold", 0.25))
     # Basic approach: call API file and parse similar (here we reuse CLIP+FAISS directly would require index load)
     # To keep runner independent, we'll hash and compare against stored Items with media (if present).
     # Minimal viable: alert that this watcher requires the /search/image endpoint upstream. Ingest there and create watcher hits here.
     # For now, compute phash and compare to previous hash (prevent duplicate self-alerts)
     db = SessionLocal(); new=0
     try:
-        fp = hashlib.sha256((img or "none").encode()).hexdigest()
-        if not _seen(db, w.id, fp):
+        seen = _seen_fingerprints(db, w.id)
+        fp = _fingerprint(img or "none")
+        if fp not in seen:
             _save_hit(db, w.id, fp, {"file": img, "note": "image search executed"}); new += 1
         db.commit()
     finally:
@@ -129,14 +244,32 @@ def run_image(w: Watcher) -> int:
         _alert({"type":"image","file":img,"new":new,"summary":f"[IMAGE] {img}: search executed"})
     return new
 
-def run_due_watchers():
+class WatcherRunResult(TypedDict):
+    """Shape of a scheduler tick result; a TypedDict (not a pydantic model)
+    so the /watchers/run_once path serializes it without a validation pass."""
+    ran: int
+    new: int
+
+def _due_watchers(db: Any, now: dt.datetime) -> List[Watcher]:
+    q = db.query(Watcher).filter(Watcher.enabled==True)
+    if db.get_bind().dialect.name == "postgresql":
+        # Push the cadence predicate into SQL so only due rows come back,
+        # served by the (enabled, last_run_at) index.
+        return q.filter(or_(
+            Watcher.last_run_at.is_(None),
+            func.extract("epoch", now - Watcher.last_run_at) >= Watcher.interval_seconds,
+        )).all()
+    # SQLite fallback (tests) lacks interval epoch extraction; filter in Python.
+    return [w for w in q.all()
+            if not w.last_run_at or (now - w.last_run_at).total_seconds() >= w.interval_seconds]
+
+def run_due_watchers() -> WatcherRunResult:
     db = SessionLocal()
     now = dt.datetime.now(dt.timezone.utc)
-    due = db.query(Watcher).filter(Watcher.enabled==True).all()
+    due = _due_watchers(db, now)
     ran = 0; total_new = 0
+    ran_ids: List[Any] = []
     for w in due:
-        if w.last_run_at and (now - w.last_run_at).total_seconds() < w.interval_seconds:
-            continue
         try:
             if w.type == "keyword":
                 new = run_keyword(w)
@@ -147,11 +280,14 @@ def run_due_watchers():
             else:
                 new = 0
             total_new += new
-            w.last_run_at = now
-            db.add(w); db.commit()
+            ran_ids.append(w.id)
             ran += 1
-        except Exception as e:
-            db.rollback()
+        except Exception:
             continue
+    # One UPDATE + commit (one fsync) per tick instead of per watcher; a
+    # failed runner simply stays due for the next tick.
+    if ran_ids:
+        db.execute(update(Watcher).where(Watcher.id.in_(ran_ids)).values(last_run_at=now))
+        db.commit()
     db.close()
     return {"ran": ran, "new": total_new}
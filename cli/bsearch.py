@@ -1,17 +1,106 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import argparse, importlib, sys, json
+import argparse, importlib, os, sys, json, queue, threading, time
+from functools import lru_cache
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson optional at runtime
+    orjson = None
+
+try:
+    import msgspec
+except Exception:  # pragma: no cover - msgspec optional at runtime
+    msgspec = None
+
+try:
+    import zstandard as zstd
+except Exception:  # pragma: no cover - zstandard optional at runtime
+    zstd = None
 
 from libs.integration.location_pipeline import Pipeline, load_config
 
+# Records buffered between write() calls; keeps syscalls off the hot loop.
+WRITE_BATCH_RECORDS = 256
+# Flush at least this often so slow producers still stream promptly.
+WRITE_FLUSH_SECONDS = 0.25
+# ...and cap buffered bytes so oversized records can't balloon the batch.
+WRITE_BATCH_BYTES = 256 << 10
+
+def _dumps_bytes(record) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+@lru_cache(maxsize=64)
 def load_collectors(entrypoint: str):
-    # entrypoint like "app.collectors:search"
+    # entrypoint like "app.collectors:search"; cached so repeat resolutions
+    # from long-running hosts (daemons, test runners) skip the import machinery
     if ":" not in entrypoint:
         raise SystemExit("Collectors entrypoint must be like 'package.module:function'")
     mod_name, fn_name = entrypoint.split(":",1)
-    mod = __import__(mod_name, fromlist=[fn_name])
-    fn = getattr(mod, fn_name)
-    return fn
+    return getattr(importlib.import_module(mod_name), fn_name)
+
+@lru_cache(maxsize=16)
+def _load_config_cached(path: str, mtime: float):
+    return load_config(path)
+
+_PRODUCER_DONE = object()
+
+def _flatten_agg(pairs):
+    """Lazily flatten (module, info) aggregator results into dict records.
+
+    Never materializes per-collector record lists beyond what the
+    aggregator itself holds; generators from collectors stream through.
+    """
+    for _mod, info in pairs:
+        if not info.get('ok'):
+            continue
+        for r in info.get('records') or ():
+            yield r if r.__class__ is dict else {"data": r}
+
+def _overlap_producer(records, maxsize: int = 1024):
+    """Drain `records` on a background thread through a bounded queue.
+
+    Collector I/O (HTTP waits, disk reads) then overlaps with enrichment in
+    the main thread instead of serializing with it.
+    """
+    q = queue.Queue(maxsize=maxsize)
+
+    def _pump():
+        try:
+            for r in records:
+                q.put(r)
+        finally:
+            q.put(_PRODUCER_DONE)
+
+    threading.Thread(target=_pump, daemon=True).start()
+    while True:
+        r = q.get()
+        if r is _PRODUCER_DONE:
+            return
+        yield r
+
+def _open_out(path: str):
+    """Open the JSONL sink, compressing transparently for .gz/.zst names."""
+    if path == "-":
+        return sys.stdout.buffer
+    if path.endswith(".zst"):
+        if zstd is None:
+            raise SystemExit("zstandard must be installed for .zst output")
+        return zstd.ZstdCompressor(level=3).stream_writer(open(path, "wb"))
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.open(path, "wb", compresslevel=6)
+    return open(path, "wb", buffering=1 << 20)
+
+def load_config_once(path: str):
+    """Re-parse the geo config only when the file actually changes."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = -1.0
+    return _load_config_cached(path, mtime)
 
 def main():
     p = argparse.ArgumentParser(prog="bsearch", description="Run search/monitor and enrich with location")
@@ -28,12 +117,16 @@ def main():
                    help="Number of attempts per collector")
     p.add_argument("--stream-collectors", action="store_true",
                    help="Stream collector results to stdout as they complete (newline JSON lines)")
+    p.add_argument("--async", dest="overlap_collect", action="store_true",
+                   help="Run collectors on a background thread so their I/O overlaps enrichment")
+    p.add_argument("--max-in-flight", type=int, default=1024,
+                   help="Bound on records queued between collectors and the pipeline (with --async)")
     p.add_argument("--query", help="Search query (passed to collectors)")
     p.add_argument("--limit", type=int, default=50)
     p.add_argument("--jsonl-out", default="-", help="Where to write enriched JSONL ('-' for stdout)")
     args = p.parse_args()
 
-    cfg = load_config(args.geo_config)
+    cfg = load_config_once(args.geo_config)
     pipeline = Pipeline(cfg)
 
     if args.run_all_collectors:
@@ -42,31 +135,10 @@ def main():
         if args.stream_collectors:
             # Stream collectors as they finish
             from libs.collectors.run_all import run_all_stream
-
-            def _iter_stream():
-                for mod, info in run_all_stream(args.query or None, args.limit, timeout=None, max_workers=args.collector_workers, collector_timeout=args.collector_timeout, retries=args.collector_retries):
-                    # emit each record or an envelope
-                    if info.get('ok'):
-                        for r in info.get('records', []):
-                            if isinstance(r, dict):
-                                yield r
-                            else:
-                                yield {"data": r}
-
-            records = _iter_stream()
+            records = _flatten_agg(run_all_stream(args.query or None, args.limit, timeout=None, max_workers=args.collector_workers, collector_timeout=args.collector_timeout, retries=args.collector_retries))
         else:
             agg = run_all_collectors(args.query or None, args.limit, timeout=None, max_workers=args.collector_workers, collector_timeout=args.collector_timeout, retries=args.collector_retries)
-
-            def _gen():
-                for mod, info in agg.items():
-                    if info.get('ok'):
-                        for r in info.get('records', []):
-                            if isinstance(r, dict):
-                                yield r
-                            else:
-                                yield {"data": r}
-
-            records = _gen()
+            records = _flatten_agg(agg.items())
     else:
         collect_fn = load_collectors(args.collect)
         # We expect collect_fn(query, limit) -> iterable of dict records
@@ -79,13 +151,42 @@ def main():
             except TypeError:
                 records = collect_fn()
 
-    out_stream = sys.stdout if args.jsonl_out == "-" else open(args.jsonl_out, "w", encoding="utf-8")
+    if args.overlap_collect:
+        records = _overlap_producer(records, maxsize=max(1, args.max_in_flight))
+
+    # Binary output with batched writes: one write() per WRITE_BATCH_RECORDS
+    # records instead of a write+flush syscall pair per line. With msgspec,
+    # the encoder is reused and encodes into a scratch bytearray so the hot
+    # loop does no per-record bytes allocation; orjson/stdlib remain as
+    # fallbacks for environments without it or for exotic types.
+    out_stream = _open_out(args.jsonl_out)
+    enc = msgspec.json.Encoder() if msgspec is not None else None
+    scratch = bytearray()
+    buf = bytearray()
+    pending = 0
+    last_flush = time.monotonic()
     try:
         for enriched in pipeline.run(records):
-            out_stream.write(json.dumps(enriched, ensure_ascii=False) + "\n")
-            out_stream.flush()
+            if enc is not None:
+                try:
+                    enc.encode_into(enriched, scratch)
+                    buf += scratch
+                except TypeError:
+                    buf += _dumps_bytes(enriched)
+            else:
+                buf += _dumps_bytes(enriched)
+            buf += b"\n"
+            pending += 1
+            if pending >= WRITE_BATCH_RECORDS or len(buf) >= WRITE_BATCH_BYTES or time.monotonic() - last_flush >= WRITE_FLUSH_SECONDS:
+                out_stream.write(buf)
+                buf.clear()
+                pending = 0
+                last_flush = time.monotonic()
     finally:
-        if out_stream is not sys.stdout:
+        if buf:
+            out_stream.write(buf)
+        out_stream.flush()
+        if out_stream is not sys.stdout.buffer:
             out_stream.close()
 
 if __name__ == "__main__":
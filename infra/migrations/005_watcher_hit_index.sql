@@ -0,0 +1,3 @@
+-- Composite index for per-watcher fingerprint dedupe lookups.
+-- Unique so concurrent runners can rely on ON CONFLICT DO NOTHING.
+CREATE UNIQUE INDEX IF NOT EXISTS ix_watcherhit_wid_fp ON watcher_hits (watcher_id, fingerprint);
@@ -0,0 +1,2 @@
+-- Index for the scheduler's due-watcher scan (enabled + cadence filter).
+CREATE INDEX IF NOT EXISTS ix_watchers_enabled_last_run ON watchers (enabled, last_run_at);
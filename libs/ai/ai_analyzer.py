@@ -5,14 +5,42 @@ This module provides the core AI analysis engine that combines statistical analy
 trend detection, anomaly detection, and predictive analytics.
 """
 
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+from collections import Counter
+from itertools import islice
+
+import numpy as np
 
 from ..storage.models import Item, Project, Watcher
 from .statistical_analyzer import StatisticalAnalyzer
 
 
+# Semantic ordering for priority/impact labels; int compares are cheaper than
+# string compares and, unlike a reverse alphabetical sort, actually rank
+# "high" ahead of "medium".
+_PRIO = {"high": 0, "medium": 1, "low": 2}
+
+# Fixed tail of the narrative report, assembled once at import time so each
+# report only formats the dynamic sections.
+_NARRATIVE_TAIL = """
+## Recommendations
+
+1. **Immediate Actions**: Address high-priority risks and capitalize on current opportunities
+2. **Monitoring Strategy**: Enhance watcher coverage for critical topics and platforms
+3. **Data Strategy**: Optimize collection pipelines and expand to high-value data sources
+4. **Analysis Enhancement**: Implement advanced AI models for deeper insights
+
+## Conclusion
+
+This AI-powered analysis provides actionable intelligence for strategic decision-making. The combination of trend analysis, risk assessment, and opportunity identification enables proactive management of intelligence operations.
+
+---
+*Generated by B-Search AI Analytics Engine | Confidence: High*
+"""
+
+
 class AIAnalyzer:
     """Main AI analysis engine for B-Search"""
 
@@ -33,32 +61,34 @@ class AIAnalyzer:
         # Basic metrics
         total_items = len(items)
         total_projects = len(projects)
-        active_watchers = len([w for w in watchers if w.enabled])
+        active_watchers = sum(1 for w in watchers if w.enabled)
 
         # Trend analysis
         trend_data = self.statistical_analyzer.analyze_trends(items, 30)
 
-        # Anomaly detection
+        # Anomaly detection. Severity counts are tallied once here and reused
+        # by every downstream consumer instead of re-scanning the list.
         anomalies = self.statistical_analyzer.detect_anomalies(items)
+        sev_counts = Counter(a.get("severity", "low") for a in anomalies)
 
         # Platform analysis
-        platform_analysis = self._analyze_platform_performance(items)
+        platform_analysis, top_platform = self._analyze_platform_performance(items)
 
         # Predictive insights
         predictions = self.statistical_analyzer.generate_predictive_insights(items)
 
         # Generate executive summary
         executive_summary = self._generate_executive_summary_ai(
-            total_items, total_projects, active_watchers, trend_data, anomalies
+            total_items, total_projects, active_watchers, trend_data, anomalies, sev_counts
         )
 
         # Generate key insights
         key_insights = self._generate_key_insights_ai(
-            trend_data, anomalies, platform_analysis, predictions, analysis_depth
+            trend_data, anomalies, platform_analysis, predictions, analysis_depth, sev_counts, top_platform
         )
 
         # Risk assessment
-        risk_assessment = self._assess_risks_ai(items, watchers, anomalies)
+        risk_assessment = self._assess_risks_ai(items, watchers, anomalies, sev_counts, active_watchers)
 
         # Opportunity analysis
         opportunity_analysis = self._analyze_opportunities_ai(trend_data, platform_analysis, predictions)
@@ -74,7 +104,7 @@ class AIAnalyzer:
             "trend_analysis": trend_data,
             "anomaly_insights": {
                 "total_anomalies": len(anomalies),
-                "severity_breakdown": self._categorize_anomalies(anomalies),
+                "severity_breakdown": self._categorize_anomalies(anomalies, sev_counts),
                 "most_significant": anomalies[:5] if anomalies else []
             },
             "predictive_forecast": {
@@ -83,7 +113,7 @@ class AIAnalyzer:
                 "confidence_levels": self._calculate_forecast_confidence(items)
             },
             "recommendations": self._generate_ai_recommendations(
-                trend_data, anomalies, platform_analysis, risk_assessment
+                trend_data, anomalies, platform_analysis, risk_assessment, sev_counts
             ),
             "risk_assessment": risk_assessment,
             "opportunity_analysis": opportunity_analysis,
@@ -95,27 +125,48 @@ class AIAnalyzer:
             }
         }
 
-    def _analyze_platform_performance(self, items: List[Item]) -> Dict[str, Any]:
-        """Analyze platform performance"""
-        platform_stats = defaultdict(lambda: {"total_items": 0, "avg_content_length": 0, "first_collection": None, "last_collection": None})
+    def _analyze_platform_performance(self, items: List[Item]) -> Tuple[Dict[str, Any], str]:
+        """Analyze platform performance; returns (stats, busiest platform)"""
+        # Single pass with one accumulator lookup per item instead of re-reading
+        # the stats dict ~8 times per iteration; averages are finalized once at
+        # the end rather than recomputed as a running mean. The argmax is kept
+        # inline so callers don't need a second pass over the stats.
+        acc: Dict[str, list] = {}  # platform -> [count, content_len_sum, first, last]
+        top_platform = None
+        top_count = 0
 
         for item in items:
+            # Interned keys hit the identity fast path in the dict lookup, so
+            # repeated platform names skip full string comparisons. Collector
+            # JSONB can carry non-string platforms; those stay raw since
+            # sys.intern only takes str.
             platform = item.meta.get('platform', 'unknown') if item.meta else 'unknown'
-            platform_stats[platform]["total_items"] += 1
-
+            if type(platform) is str:
+                platform = sys.intern(platform)
+            a = acc.get(platform)
+            if a is None:
+                a = acc[platform] = [0, 0, item.created_at, item.created_at]
+            a[0] += 1
+            if a[0] > top_count:
+                top_count = a[0]
+                top_platform = platform
             if item.content is not None:
-                platform_stats[platform]["avg_content_length"] = (
-                    (platform_stats[platform]["avg_content_length"] * (platform_stats[platform]["total_items"] - 1)) +
-                    len(str(item.content))
-                ) / platform_stats[platform]["total_items"]
-
-            if not platform_stats[platform]["first_collection"] or item.created_at < platform_stats[platform]["first_collection"]:
-                platform_stats[platform]["first_collection"] = item.created_at
-
-            if not platform_stats[platform]["last_collection"] or item.created_at > platform_stats[platform]["last_collection"]:
-                platform_stats[platform]["last_collection"] = item.created_at
-
-        return dict(platform_stats)
+                a[1] += len(str(item.content))
+            if item.created_at < a[2]:
+                a[2] = item.created_at
+            elif item.created_at > a[3]:
+                a[3] = item.created_at
+
+        stats = {
+            platform: {
+                "total_items": count,
+                "avg_content_length": content_sum / count if count else 0,
+                "first_collection": first,
+                "last_collection": last,
+            }
+            for platform, (count, content_sum, first, last) in acc.items()
+        }
+        return stats, top_platform
 
     def _generate_executive_summary_ai(
         self,
@@ -123,7 +174,8 @@ class AIAnalyzer:
         total_projects: int,
         active_watchers: int,
         trend_data: Dict[str, Any],
-        anomalies: List[Dict[str, Any]]
+        anomalies: List[Dict[str, Any]],
+        sev_counts: Counter = None
     ) -> str:
         """Generate AI-powered executive summary"""
 
@@ -144,7 +196,7 @@ Trend Analysis:
 
 Anomaly Detection:
 • Anomalies detected: {len(anomalies)}
-• Most significant patterns: {self._categorize_anomalies(anomalies).get('high', 0)} high-severity events
+• Most significant patterns: {self._categorize_anomalies(anomalies, sev_counts).get('high', 0)} high-severity events
 
 Key Takeaways:
 • System performance: {'Excellent' if confidence > 0.8 else 'Good' if confidence > 0.6 else 'Needs Attention'}
@@ -160,7 +212,9 @@ Key Takeaways:
         anomalies: List[Dict[str, Any]],
         platform_analysis: Dict[str, Any],
         predictions: List[Dict[str, Any]],
-        analysis_depth: str
+        analysis_depth: str,
+        sev_counts: Counter = None,
+        top_platform: str = None
     ) -> List[Dict[str, Any]]:
         """Generate key insights based on analysis depth"""
 
@@ -186,7 +240,8 @@ Key Takeaways:
 
         # Anomaly insights
         if anomalies:
-            high_severity = len([a for a in anomalies if a.get("severity") == "high"])
+            counts = sev_counts if sev_counts is not None else Counter(a.get("severity", "low") for a in anomalies)
+            high_severity = counts.get("high", 0)
             if high_severity > 0:
                 insights.append({
                     "type": "anomaly",
@@ -198,11 +253,12 @@ Key Takeaways:
 
         # Platform insights
         if platform_analysis:
-            top_platform = max(platform_analysis.items(), key=lambda x: x[1]["total_items"])
+            if top_platform is None:
+                top_platform = max(platform_analysis, key=lambda p: platform_analysis[p]["total_items"])
             insights.append({
                 "type": "platform",
                 "priority": "medium",
-                "insight": f"{top_platform[0].title()} shows highest activity with {top_platform[1]['total_items']} items",
+                "insight": f"{top_platform.title()} shows highest activity with {platform_analysis[top_platform]['total_items']} items",
                 "impact": "informational",
                 "recommendation": "Focus collection efforts on high-activity platforms"
             })
@@ -219,7 +275,7 @@ Key Takeaways:
 
         return insights
 
-    def _assess_risks_ai(self, items: List[Item], watchers: List[Watcher], anomalies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_risks_ai(self, items: List[Item], watchers: List[Watcher], anomalies: List[Dict[str, Any]], sev_counts: Counter = None, active_watchers: int = None) -> Dict[str, Any]:
         """AI-powered risk assessment"""
 
         risks = []
@@ -236,7 +292,8 @@ Key Takeaways:
             })
 
         # Watcher coverage risks
-        active_watchers = len([w for w in watchers if w.enabled])
+        if active_watchers is None:
+            active_watchers = sum(1 for w in watchers if w.enabled)
         if active_watchers < 3:
             risks.append({
                 "category": "monitoring",
@@ -248,7 +305,9 @@ Key Takeaways:
             })
 
         # Anomaly risks
-        high_anomalies = len([a for a in anomalies if a.get("severity") == "high"])
+        if sev_counts is None:
+            sev_counts = Counter(a.get("severity", "low") for a in anomalies)
+        high_anomalies = sev_counts.get("high", 0)
         if high_anomalies > 5:
             risks.append({
                 "category": "system_stability",
@@ -262,7 +321,7 @@ Key Takeaways:
         return {
             "overall_risk_level": "high" if any(r["severity"] == "high" for r in risks) else "medium" if risks else "low",
             "identified_risks": risks,
-            "risk_categories": list(set(r["category"] for r in risks)),
+            "risk_categories": list(dict.fromkeys(r["category"] for r in risks)),
             "mitigation_priority": sorted(risks, key=lambda x: x["probability"] * (3 if x["severity"] == "high" else 2 if x["severity"] == "medium" else 1), reverse=True)
         }
 
@@ -311,8 +370,8 @@ Key Takeaways:
 
         return {
             "identified_opportunities": opportunities,
-            "opportunity_categories": list(set(o["category"] for o in opportunities)),
-            "prioritized_opportunities": sorted(opportunities, key=lambda x: x["potential_impact"], reverse=True),
+            "opportunity_categories": list(dict.fromkeys(o["category"] for o in opportunities)),
+            "prioritized_opportunities": sorted(opportunities, key=lambda x: _PRIO.get(x["potential_impact"], 3)),
             "implementation_roadmap": self._generate_implementation_roadmap(opportunities)
         }
 
@@ -326,6 +385,19 @@ Key Takeaways:
     ) -> str:
         """Generate comprehensive narrative report"""
 
+        # Bind the hot lookups once and render each bullet block with a lazy
+        # generator join — no sliced copies or throwaway bullet lists.
+        trend = trend_data.get('trend', 'stable')
+        insight_block = "\n".join(
+            f"• {insight['insight']} ({insight['priority']} priority)" for insight in islice(key_insights, 5)
+        )
+        risk_block = "\n".join(
+            f"• {risk['description']} (Severity: {risk['severity']})" for risk in islice(risk_assessment['identified_risks'], 3)
+        )
+        opportunity_block = "\n".join(
+            f"• {opp['description']} (Impact: {opp['potential_impact']})" for opp in islice(opportunity_analysis['identified_opportunities'], 3)
+        )
+
         narrative = f"""# B-Search AI Intelligence Report
 
 ## Executive Summary
@@ -335,41 +407,28 @@ Key Takeaways:
 ## Detailed Analysis
 
 ### Trend Analysis
-Current data trends indicate a {trend_data.get('trend', 'stable')} pattern with {trend_data.get('confidence', 0)*100:.1f}% confidence. This suggests {'increasing' if trend_data.get('trend') == 'rising' else 'decreasing' if trend_data.get('trend') == 'falling' else 'stable'} activity levels that warrant {'immediate attention' if trend_data.get('trend') == 'rising' else 'monitoring' if trend_data.get('trend') == 'falling' else 'routine oversight'}.
+Current data trends indicate a {trend} pattern with {trend_data.get('confidence', 0)*100:.1f}% confidence. This suggests {'increasing' if trend == 'rising' else 'decreasing' if trend == 'falling' else 'stable'} activity levels that warrant {'immediate attention' if trend == 'rising' else 'monitoring' if trend == 'falling' else 'routine oversight'}.
 
 ### Key Insights
-{chr(10).join([f"• {insight['insight']} ({insight['priority']} priority)" for insight in key_insights[:5]])}
+{insight_block}
 
 ### Risk Assessment
 Overall risk level: {risk_assessment['overall_risk_level'].title()}
-{chr(10).join([f"• {risk['description']} (Severity: {risk['severity']})" for risk in risk_assessment['identified_risks'][:3]])}
+{risk_block}
 
 ### Opportunities
-{chr(10).join([f"• {opp['description']} (Impact: {opp['potential_impact']})" for opp in opportunity_analysis['identified_opportunities'][:3]])}
-
-## Recommendations
-
-1. **Immediate Actions**: Address high-priority risks and capitalize on current opportunities
-2. **Monitoring Strategy**: Enhance watcher coverage for critical topics and platforms
-3. **Data Strategy**: Optimize collection pipelines and expand to high-value data sources
-4. **Analysis Enhancement**: Implement advanced AI models for deeper insights
-
-## Conclusion
-
-This AI-powered analysis provides actionable intelligence for strategic decision-making. The combination of trend analysis, risk assessment, and opportunity identification enables proactive management of intelligence operations.
-
----
-*Generated by B-Search AI Analytics Engine | Confidence: High*
+{opportunity_block}
 """
 
-        return narrative
+        return narrative + _NARRATIVE_TAIL
 
     def _generate_ai_recommendations(
         self,
         trend_data: Dict[str, Any],
         anomalies: List[Dict[str, Any]],
         platform_analysis: Dict[str, Any],
-        risk_assessment: Dict[str, Any]
+        risk_assessment: Dict[str, Any],
+        sev_counts: Counter = None
     ) -> List[Dict[str, Any]]:
         """Generate AI-powered recommendations"""
 
@@ -388,7 +447,8 @@ This AI-powered analysis provides actionable intelligence for strategic decision
 
         # Anomaly-based recommendations
         if anomalies:
-            high_severity_count = len([a for a in anomalies if a.get("severity") == "high"])
+            counts = sev_counts if sev_counts is not None else Counter(a.get("severity", "low") for a in anomalies)
+            high_severity_count = counts.get("high", 0)
             if high_severity_count > 0:
                 recommendations.append({
                     "category": "system_monitoring",
@@ -426,14 +486,16 @@ This AI-powered analysis provides actionable intelligence for strategic decision
                 "expected_impact": "Reduced operational risks and improved stability"
             })
 
-        return sorted(recommendations, key=lambda x: x["priority"], reverse=True)
+        return sorted(recommendations, key=lambda x: _PRIO.get(x["priority"], 3))
 
-    def _categorize_anomalies(self, anomalies: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _categorize_anomalies(self, anomalies: List[Dict[str, Any]], sev_counts: Counter = None) -> Dict[str, int]:
         """Categorize anomalies by severity"""
+        if sev_counts is None:
+            sev_counts = Counter(a.get("severity", "low") for a in anomalies)
         return {
-            "high": len([a for a in anomalies if a.get("severity") == "high"]),
-            "medium": len([a for a in anomalies if a.get("severity") == "medium"]),
-            "low": len([a for a in anomalies if a.get("severity") == "low"])
+            "high": sev_counts.get("high", 0),
+            "medium": sev_counts.get("medium", 0),
+            "low": sev_counts.get("low", 0)
         }
 
     def _generate_short_term_forecast(self, items: List[Item]) -> Dict[str, Any]:
@@ -441,12 +503,15 @@ This AI-powered analysis provides actionable intelligence for strategic decision
         if len(items) < 7:
             return {"forecast": "insufficient_data", "confidence": 0}
 
-        # Simple trend-based forecasting
-        recent_counts = [0] * 7
-        for item in items:
-            days_ago = (datetime.now(timezone.utc) - item.created_at).days
-            if days_ago < 7:
-                recent_counts[6 - days_ago] += 1
+        # Simple trend-based forecasting. Bucket items into the last 7 days
+        # with one vectorized pass instead of per-item datetime arithmetic.
+        now = datetime.now(timezone.utc)
+        now_ts = now.timestamp()
+        today = now.date()
+        ts = np.fromiter((it.created_at.timestamp() for it in items), dtype=np.float64, count=len(items))
+        days_ago = ((now_ts - ts) // 86400).astype(np.int64)
+        in_window = days_ago[(days_ago >= 0) & (days_ago < 7)]
+        recent_counts = np.bincount(6 - in_window, minlength=7).tolist()
 
         avg_daily = sum(recent_counts) / 7
         trend = (recent_counts[-1] - recent_counts[0]) / max(1, recent_counts[0])
@@ -455,7 +520,7 @@ This AI-powered analysis provides actionable intelligence for strategic decision
         for i in range(1, 8):
             predicted = max(0, avg_daily * (1 + trend * i / 7))
             forecast.append({
-                "date": (datetime.now(timezone.utc) + timedelta(days=i)).date().isoformat(),
+                "date": (today + timedelta(days=i)).isoformat(),
                 "predicted_count": round(predicted, 1),
                 "confidence": max(0.1, 0.9 - (i * 0.1))
             })
@@ -6,8 +6,131 @@ and content analysis capabilities.
 """
 
 from typing import List, Dict, Any
-import statistics
+import copy
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+
+# Focus-area keyword lists, compiled below into one alternation per requested
+# focus combination so each item is scanned once instead of per keyword.
+# Mock analysis outputs, built once at import time; the methods below hand out
+# shallow copies so callers can mutate their own result safely.
+_KEY_POINTS = (
+    "Emerging technology trends gaining traction",
+    "Social media engagement showing seasonal patterns",
+    "Political discourse maintaining consistent levels",
+    "Economic indicators showing mixed signals",
+    "Cultural events influencing online discussions",
+)
+
+_SENTIMENT_OVERVIEW = {
+    "overall": "neutral",
+    "distribution": {"positive": 35, "negative": 25, "neutral": 40},
+    "trends": "stable",
+    "key_drivers": ["technology_news", "social_issues"],
+}
+
+_CONTENT_CATEGORIES = {
+    "news": 45,
+    "opinion": 25,
+    "discussion": 20,
+    "analysis": 10,
+}
+
+_TEMPORAL_INSIGHTS = (
+    "Content volume shows consistent growth across periods",
+    "Topic diversity increased by 15% compared to previous period",
+    "Sentiment remained stable with slight positive trend",
+)
+
+_PLATFORM_INSIGHTS = (
+    "Platform A shows highest engagement with technical content",
+    "Platform B has strongest presence in social issues",
+    "Cross-platform consistency in key topic coverage",
+)
+
+_OVERALL_TRENDS = {
+    "volume_trend": "increasing",
+    "topic_diversity": "high",
+    "sentiment_stability": "stable",
+    "engagement_level": "moderate",
+}
+
+_CONTENT_CLUSTERS = (
+    {
+        "id": 1,
+        "name": "Technology & Innovation",
+        "keywords": ["AI", "machine learning", "blockchain", "software", "digital"],
+        "prevalence": 0.28,
+        "trend": "rising",
+        "documents": 280
+    },
+    {
+        "id": 2,
+        "name": "Politics & Government",
+        "keywords": ["government", "election", "policy", "politics", "law"],
+        "prevalence": 0.22,
+        "trend": "stable",
+        "documents": 220
+    },
+    {
+        "id": 3,
+        "name": "Business & Economy",
+        "keywords": ["economy", "market", "business", "finance", "startup"],
+        "prevalence": 0.18,
+        "trend": "rising",
+        "documents": 180
+    },
+    {
+        "id": 4,
+        "name": "Social Issues",
+        "keywords": ["society", "community", "social", "culture", "education"],
+        "prevalence": 0.15,
+        "trend": "falling",
+        "documents": 150
+    },
+    {
+        "id": 5,
+        "name": "Entertainment & Media",
+        "keywords": ["entertainment", "media", "celebrity", "sports", "music"],
+        "prevalence": 0.12,
+        "trend": "stable",
+        "documents": 120
+    },
+)
+
+# SoA companions to the cluster table: document counts pre-summed at import
+# time so per-call rollups are an O(1) index instead of a Python reduction.
+_CLUSTER_DOC_CUMSUM = np.cumsum([c["documents"] for c in _CONTENT_CLUSTERS])
+
+_FOCUS_TERMS = {
+    "technology": ("tech", "ai", "software", "digital"),
+    "politics": ("government", "election", "policy", "politics"),
+    "business": ("economy", "market", "business", "finance"),
+    "social": ("society", "community", "social", "culture"),
+}
+
+
+@lru_cache(maxsize=None)
+def _summary_confidence(technical: bool, large_set: bool) -> float:
+    """Confidence only depends on these two flags; four cached entries total."""
+    base_confidence = 0.8
+    if technical:
+        base_confidence += 0.1
+    elif large_set:
+        base_confidence += 0.05
+    return min(0.95, base_confidence)
+
+
+def _as_str(value) -> str:
+    """Coerce a field to str without re-wrapping values that already are."""
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
 
 
 class ContentSummarizer:
@@ -15,31 +138,78 @@ class ContentSummarizer:
 
     def __init__(self):
         self.summary_types = ["executive", "technical", "general"]
+        self._summary_types = frozenset(self.summary_types)
         self.max_summary_length = 1000
+        # Memoizes whole summaries per content set. Keys use object identity,
+        # so a hit costs O(N) id() calls instead of re-running the content
+        # scans; the cache is cleared wholesale once it grows past its bound.
+        # Entries hold the item tuple itself: the references pin the ids used
+        # in the key, so a garbage-collected set can never alias a later one.
+        self._summary_cache = {}
+        self._focus_pattern_cache = {}
+
+    def _cached_content_summary(
+        self,
+        content_items: List[Dict[str, Any]],
+        summary_type: str,
+        max_length: int,
+        include_key_points: bool,
+        _generated_at: str = None
+    ) -> Dict[str, Any]:
+        items = tuple(content_items)
+        key = (tuple(map(id, items)), summary_type, max_length, include_key_points)
+        entry = self._summary_cache.get(key)
+        if entry is None:
+            if len(self._summary_cache) >= 128:
+                self._summary_cache.clear()
+            summary = self.generate_content_summary(
+                content_items,
+                summary_type=summary_type,
+                max_length=max_length,
+                include_key_points=include_key_points,
+                _generated_at=_generated_at
+            )
+            self._summary_cache[key] = (items, summary)
+        else:
+            summary = entry[1]
+        # Deep copy both ways: a caller mutating its result must not corrupt
+        # the cached summary handed to later callers.
+        return copy.deepcopy(summary)
 
     def generate_content_summary(
         self,
         content_items: List[Dict[str, Any]],
         summary_type: str = "executive",
         max_length: int = 500,
-        include_key_points: bool = True
+        include_key_points: bool = True,
+        _generated_at: str = None
     ) -> Dict[str, Any]:
-        """Generate AI-powered content summary"""
+        """Generate AI-powered content summary
+
+        `_generated_at` lets batch callers stamp many summaries with one
+        datetime.now() call instead of one per set.
+        """
 
-        if summary_type not in self.summary_types:
+        if summary_type not in self._summary_types:
             raise ValueError(f"Unsupported summary type: {summary_type}. Supported: {self.summary_types}")
 
-        # Analyze content
+        # Analyze content. The technical and general summaries both need
+        # per-item stats, so they share a single fused pass instead of each
+        # helper re-walking (and re-stringifying) the whole list.
         total_items = len(content_items)
-        content_lengths = [len(str(item.get("content", ""))) for item in content_items]
 
-        # Generate summary based on type
         if summary_type == "executive":
-            summary = self._generate_executive_content_summary(content_items, max_length)
-        elif summary_type == "technical":
-            summary = self._generate_technical_content_summary(content_items, max_length)
+            summary = self._generate_executive_content_summary(total_items, max_length)
         else:
-            summary = self._generate_general_content_summary(content_items, max_length)
+            total_content_length = 0
+            platforms = Counter()
+            for item in content_items:
+                total_content_length += len(_as_str(item.get("content")))
+                platforms[_as_str(item.get("platform")) or "unknown"] += 1
+            if summary_type == "technical":
+                summary = self._generate_technical_content_summary(total_items, total_content_length, platforms, max_length)
+            else:
+                summary = self._generate_general_content_summary(total_items, platforms, max_length)
 
         # Extract key points if requested
         key_points = []
@@ -57,72 +227,93 @@ class ContentSummarizer:
             "key_points": key_points,
             "sentiment_overview": sentiment_overview,
             "content_categories": content_categories,
-            "confidence_score": self._calculate_summary_confidence(content_items, summary_type),
+            "confidence_score": self._calculate_summary_confidence(total_items, summary_type),
             "metadata": {
                 "total_items_processed": total_items,
                 "summary_type": summary_type,
                 "max_length": max_length,
-                "generated_at": datetime.now(timezone.utc).isoformat()
+                "generated_at": _generated_at or datetime.now(timezone.utc).isoformat()
             }
         }
 
-    def _generate_executive_content_summary(self, content_items: List[Dict[str, Any]], max_length: int) -> str:
+    def _generate_executive_content_summary(self, total_items: int, max_length: int) -> str:
         """Generate executive-level content summary"""
-        total_items = len(content_items)
         return f"Analysis of {total_items} content items reveals key themes and patterns. The content shows diverse topics with {'positive' if total_items > 50 else 'moderate'} engagement levels. Key insights include emerging trends and important developments across monitored platforms."
 
-    def _generate_technical_content_summary(self, content_items: List[Dict[str, Any]], max_length: int) -> str:
+    def _generate_technical_content_summary(self, total_items: int, total_content_length: int, platforms: Counter, max_length: int) -> str:
         """Generate technical content summary"""
-        total_items = len(content_items)
-        avg_length = sum(len(str(item.get("content", ""))) for item in content_items) / max(1, total_items)
-        return f"Technical analysis of {total_items} content items (avg. length: {avg_length:.0f} chars). Content distribution shows platform diversity with metadata completeness of 87%. NLP analysis indicates topic clustering around {len(set(str(item.get('platform', '')) for item in content_items))} distinct categories."
+        avg_length = total_content_length / max(1, total_items)
+        return f"Technical analysis of {total_items} content items (avg. length: {avg_length:.0f} chars). Content distribution shows platform diversity with metadata completeness of 87%. NLP analysis indicates topic clustering around {len(platforms)} distinct categories."
 
-    def _generate_general_content_summary(self, content_items: List[Dict[str, Any]], max_length: int) -> str:
+    def _generate_general_content_summary(self, total_items: int, platforms: Counter, max_length: int) -> str:
         """Generate general content summary"""
-        total_items = len(content_items)
-        platforms = set(str(item.get("platform", "unknown")) for item in content_items)
         return f"Content analysis covers {total_items} items across {len(platforms)} platforms. The collection includes diverse topics and perspectives, providing comprehensive coverage of monitored subjects with good temporal distribution."
 
     def _extract_key_points(self, content_items: List[Dict[str, Any]], max_points: int) -> List[str]:
         """Extract key points from content"""
         # Mock key point extraction - in real implementation, this would use NLP
-        return [
-            "Emerging technology trends gaining traction",
-            "Social media engagement showing seasonal patterns",
-            "Political discourse maintaining consistent levels",
-            "Economic indicators showing mixed signals",
-            "Cultural events influencing online discussions"
-        ][:max_points]
+        return list(_KEY_POINTS[:max_points])
 
     def _analyze_content_sentiment(self, content_items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze sentiment in content"""
         # Mock sentiment analysis
-        return {
-            "overall": "neutral",
-            "distribution": {"positive": 35, "negative": 25, "neutral": 40},
-            "trends": "stable",
-            "key_drivers": ["technology_news", "social_issues"]
-        }
+        return dict(_SENTIMENT_OVERVIEW)
 
     def _categorize_content(self, content_items: List[Dict[str, Any]]) -> Dict[str, int]:
         """Categorize content by type"""
         # Mock content categorization
-        return {
-            "news": 45,
-            "opinion": 25,
-            "discussion": 20,
-            "analysis": 10
-        }
+        return dict(_CONTENT_CATEGORIES)
 
-    def _calculate_summary_confidence(self, content_items: List[Dict[str, Any]], summary_type: str) -> float:
+    def _calculate_summary_confidence(self, total_items: int, summary_type: str) -> float:
         """Calculate confidence score for summary"""
-        base_confidence = 0.8
-        if summary_type == "technical":
-            base_confidence += 0.1
-        elif len(content_items) > 100:
-            base_confidence += 0.05
+        return _summary_confidence(summary_type == "technical", total_items > 100)
 
-        return min(0.95, base_confidence)
+    def generate_content_summary_streaming(
+        self,
+        content_items,
+        summary_type: str = "executive",
+        max_length: int = 500,
+        include_key_points: bool = True,
+        _generated_at: str = None
+    ) -> Dict[str, Any]:
+        """Summarize a lazy iterable of items without materializing it.
+
+        One pass accumulates everything every summary type needs, so peak
+        memory stays at the platform set rather than the whole record stream.
+        """
+        if summary_type not in self._summary_types:
+            raise ValueError(f"Unsupported summary type: {summary_type}. Supported: {self.summary_types}")
+
+        total_items = 0
+        total_content_length = 0
+        platforms = Counter()
+        for item in content_items:
+            total_items += 1
+            total_content_length += len(_as_str(item.get("content")))
+            platforms[_as_str(item.get("platform")) or "unknown"] += 1
+
+        if summary_type == "executive":
+            summary = self._generate_executive_content_summary(total_items, max_length)
+        elif summary_type == "technical":
+            summary = self._generate_technical_content_summary(total_items, total_content_length, platforms, max_length)
+        else:
+            summary = self._generate_general_content_summary(total_items, platforms, max_length)
+
+        key_points = self._extract_key_points((), min(10, total_items // 2)) if include_key_points else []
+
+        return {
+            "summary": summary,
+            "key_points": key_points,
+            "sentiment_overview": self._analyze_content_sentiment(()),
+            "content_categories": self._categorize_content(()),
+            "confidence_score": self._calculate_summary_confidence(total_items, summary_type),
+            "metadata": {
+                "total_items_processed": total_items,
+                "summary_type": summary_type,
+                "max_length": max_length,
+                "generated_at": _generated_at or datetime.now(timezone.utc).isoformat()
+            }
+        }
 
     def generate_targeted_summary(
         self,
@@ -141,21 +332,25 @@ class ContentSummarizer:
             include_key_points=True
         )
 
+    def _focus_pattern(self, focus_areas: List[str]):
+        """Compiled alternation over the terms of the requested focus areas."""
+        key = frozenset(a for a in focus_areas if a in _FOCUS_TERMS)
+        if not key:
+            return None
+        pattern = self._focus_pattern_cache.get(key)
+        if pattern is None:
+            terms = (t for a in sorted(key) for t in _FOCUS_TERMS[a])
+            pattern = self._focus_pattern_cache[key] = re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+        return pattern
+
     def _filter_content_by_focus(self, content_items: List[Dict[str, Any]], focus_areas: List[str]) -> List[Dict[str, Any]]:
         """Filter content based on focus areas"""
-        filtered = []
+        pattern = self._focus_pattern(focus_areas)
+        if pattern is None:
+            return content_items[:10]
 
-        for item in content_items:
-            content = str(item.get("content", "")).lower()
-
-            if "technology" in focus_areas and any(term in content for term in ["tech", "ai", "software", "digital"]):
-                filtered.append(item)
-            elif "politics" in focus_areas and any(term in content for term in ["government", "election", "policy", "politics"]):
-                filtered.append(item)
-            elif "business" in focus_areas and any(term in content for term in ["economy", "market", "business", "finance"]):
-                filtered.append(item)
-            elif "social" in focus_areas and any(term in content for term in ["society", "community", "social", "culture"]):
-                filtered.append(item)
+        search = pattern.search
+        filtered = [item for item in content_items if search(_as_str(item.get("content")))]
 
         return filtered if filtered else content_items[:10]  # Return top 10 if no matches
 
@@ -165,15 +360,21 @@ class ContentSummarizer:
         comparison_type: str = "temporal"
     ) -> Dict[str, Any]:
         """Generate comparative summary across different content sets"""
-        summaries = {}
-
-        for set_name, items in content_sets.items():
-            summaries[set_name] = self.generate_content_summary(
-                items,
-                summary_type="general",
-                max_length=300,
-                include_key_points=False
-            )
+        # The per-set summaries are independent, so fan them out on a small
+        # thread pool; zip keeps the result order aligned with the input dict.
+        generated_at = datetime.now(timezone.utc).isoformat()
+        set_names = list(content_sets)
+        with ThreadPoolExecutor(max_workers=min(4, max(1, len(set_names)))) as pool:
+            summaries = dict(zip(set_names, pool.map(
+                lambda name: self._cached_content_summary(
+                    content_sets[name],
+                    summary_type="general",
+                    max_length=300,
+                    include_key_points=False,
+                    _generated_at=generated_at
+                ),
+                set_names
+            )))
 
         # Generate comparison insights
         comparison_insights = self._generate_comparison_insights(summaries, comparison_type)
@@ -182,36 +383,20 @@ class ContentSummarizer:
             "individual_summaries": summaries,
             "comparison_insights": comparison_insights,
             "overall_trends": self._extract_overall_trends(summaries),
-            "generated_at": datetime.now(timezone.utc).isoformat()
+            "generated_at": generated_at
         }
 
     def _generate_comparison_insights(self, summaries: Dict[str, Any], comparison_type: str) -> List[str]:
         """Generate insights from comparative analysis"""
-        insights = []
-
         if comparison_type == "temporal":
-            insights.extend([
-                "Content volume shows consistent growth across periods",
-                "Topic diversity increased by 15% compared to previous period",
-                "Sentiment remained stable with slight positive trend"
-            ])
-        elif comparison_type == "platform":
-            insights.extend([
-                "Platform A shows highest engagement with technical content",
-                "Platform B has strongest presence in social issues",
-                "Cross-platform consistency in key topic coverage"
-            ])
-
-        return insights
+            return list(_TEMPORAL_INSIGHTS)
+        if comparison_type == "platform":
+            return list(_PLATFORM_INSIGHTS)
+        return []
 
     def _extract_overall_trends(self, summaries: Dict[str, Any]) -> Dict[str, Any]:
         """Extract overall trends from multiple summaries"""
-        return {
-            "volume_trend": "increasing",
-            "topic_diversity": "high",
-            "sentiment_stability": "stable",
-            "engagement_level": "moderate"
-        }
+        return dict(_OVERALL_TRENDS)
 
     def generate_content_clusters(
         self,
@@ -220,54 +405,13 @@ class ContentSummarizer:
     ) -> Dict[str, Any]:
         """Generate content clusters and themes"""
         # Mock clustering - in real implementation, this would use ML clustering
-        clusters = [
-            {
-                "id": 1,
-                "name": "Technology & Innovation",
-                "keywords": ["AI", "machine learning", "blockchain", "software", "digital"],
-                "prevalence": 0.28,
-                "trend": "rising",
-                "documents": 280
-            },
-            {
-                "id": 2,
-                "name": "Politics & Government",
-                "keywords": ["government", "election", "policy", "politics", "law"],
-                "prevalence": 0.22,
-                "trend": "stable",
-                "documents": 220
-            },
-            {
-                "id": 3,
-                "name": "Business & Economy",
-                "keywords": ["economy", "market", "business", "finance", "startup"],
-                "prevalence": 0.18,
-                "trend": "rising",
-                "documents": 180
-            },
-            {
-                "id": 4,
-                "name": "Social Issues",
-                "keywords": ["society", "community", "social", "culture", "education"],
-                "prevalence": 0.15,
-                "trend": "falling",
-                "documents": 150
-            },
-            {
-                "id": 5,
-                "name": "Entertainment & Media",
-                "keywords": ["entertainment", "media", "celebrity", "sports", "music"],
-                "prevalence": 0.12,
-                "trend": "stable",
-                "documents": 120
-            }
-        ]
+        clusters = _CONTENT_CLUSTERS[:num_clusters]
 
         return {
-            "clusters": clusters[:num_clusters],
+            "clusters": list(clusters),
             "clustering_method": "keyword_based",
             "confidence_score": 0.85,
-            "total_documents": sum(c["documents"] for c in clusters[:num_clusters])
+            "total_documents": int(_CLUSTER_DOC_CUMSUM[len(clusters) - 1]) if clusters else 0
         }
 
     def analyze_content_quality(
@@ -278,36 +422,29 @@ class ContentSummarizer:
         if not content_items:
             return {"quality_score": 0, "metrics": {}}
 
-        # Calculate quality metrics
-        completeness_scores = []
-        relevance_scores = []
-        timeliness_scores = []
-
-        for item in content_items:
-            # Mock quality scoring
-            completeness = 0.8 if item.get("content") else 0.3
-            relevance = 0.7  # Mock relevance score
-            timeliness = 0.9  # Mock timeliness score
+        # Mock quality scoring: relevance/timeliness are constants and
+        # completeness only depends on content presence, so one boolean array
+        # replaces the three Python score lists and their mean passes.
+        total = len(content_items)
+        has_content = np.fromiter((bool(item.get("content")) for item in content_items), dtype=np.bool_, count=total)
+        with_content = int(has_content.sum())
+        completeness_scores = np.where(has_content, 0.8, 0.3)
 
-            completeness_scores.append(completeness)
-            relevance_scores.append(relevance)
-            timeliness_scores.append(timeliness)
+        completeness = float(completeness_scores.mean())
+        relevance = 0.7  # Mock relevance score
+        timeliness = 0.9  # Mock timeliness score
 
         return {
-            "quality_score": round(statistics.mean([
-                statistics.mean(completeness_scores),
-                statistics.mean(relevance_scores),
-                statistics.mean(timeliness_scores)
-            ]), 2),
+            "quality_score": round((completeness + relevance + timeliness) / 3, 2),
             "metrics": {
-                "completeness": round(statistics.mean(completeness_scores), 2),
-                "relevance": round(statistics.mean(relevance_scores), 2),
-                "timeliness": round(statistics.mean(timeliness_scores), 2)
+                "completeness": round(completeness, 2),
+                "relevance": round(relevance, 2),
+                "timeliness": round(timeliness, 2)
             },
             "distribution": {
-                "high_quality": len([s for s in completeness_scores if s > 0.8]),
-                "medium_quality": len([s for s in completeness_scores if 0.6 <= s <= 0.8]),
-                "low_quality": len([s for s in completeness_scores if s < 0.6])
+                "high_quality": int((completeness_scores > 0.8).sum()),
+                "medium_quality": with_content,
+                "low_quality": total - with_content
             }
         }
 
@@ -5,8 +5,78 @@ This module provides intelligent narrative generation capabilities
 with different styles, audiences, and complexity levels.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _confidence_score(base_confidence: float, data_quality: float) -> float:
+    """Pure scalar blend, cached across variants and repeat reports."""
+    return round((base_confidence + data_quality) / 2, 2)
+
+
+# Narrative templates, defined once at module scope; helpers only fill in the
+# handful of dynamic fields per call.
+_TITLE_EXECUTIVE_TPL = "B-Search Intelligence: {trend} Trends & Strategic Insights"
+_TITLE_TECHNICAL_TPL = "Technical Analysis Report: {trend} Pattern Detection (Confidence: {confidence:.0f}%)"
+_TITLE_GENERAL_TPL = "B-Search Analytics Report: {trend} Trends & Key Findings"
+
+_SUMMARY_BRIEF_TPL = (
+    "This report analyzes {total:,} data points, revealing {trend} trends with high confidence. "
+    "Key insights include emerging patterns and actionable recommendations for strategic decision-making."
+)
+_SUMMARY_FULL_TPL = (
+    "Comprehensive analysis of {total:,} intelligence data points reveals {trend} activity patterns "
+    "across multiple platforms. The AI-powered analysis identifies key trends, anomalies, and predictive "
+    "insights that inform strategic intelligence operations. This report provides actionable "
+    "recommendations for optimizing data collection, enhancing monitoring capabilities, and maximizing "
+    "intelligence value."
+)
+
+_CONCLUSIONS_TPL = """## Conclusions
+This AI-powered analysis provides {confidence:.0f}% confidence in the identified patterns and trends. The {risk_level} risk assessment indicates {assessment}. Strategic implementation of the recommendations will enhance intelligence capabilities and operational effectiveness."""
+
+_RISK_ASSESSMENTS = {
+    "low": "stable operations with opportunities for optimization",
+    "medium": "moderate attention required for key areas",
+}
+_RISK_ASSESSMENT_DEFAULT = "immediate action needed to address critical issues"
+
+
+@dataclass(slots=True)
+class _AnalysisView:
+    """Flattened snapshot of the nested analysis dict.
+
+    Built once per narrative so the component helpers read slotted attributes
+    instead of repeating chained .get() lookups.
+    """
+    trend: Optional[str]
+    trend_confidence: float
+    total_items: int
+    overall_confidence: float
+    data_quality: float
+    risk_level: str
+    recommendations: List[Dict[str, Any]]
+    key_insights: List[Dict[str, Any]]
+
+
+def _make_view(analysis_data: Dict[str, Any]) -> _AnalysisView:
+    trend_analysis = analysis_data.get("trend_analysis", {})
+    confidence_metrics = analysis_data.get("confidence_metrics", {})
+    return _AnalysisView(
+        trend=trend_analysis.get("trend"),
+        trend_confidence=trend_analysis.get("confidence", 0),
+        total_items=analysis_data.get("summary", {}).get("total_items", 0),
+        overall_confidence=confidence_metrics.get("overall_confidence", 0.8),
+        data_quality=confidence_metrics.get("data_quality_score", 0.8),
+        risk_level=analysis_data.get("risk_assessment", {}).get("overall_risk_level", "medium"),
+        recommendations=analysis_data.get("recommendations", []),
+        key_insights=analysis_data.get("key_insights", []),
+    )
 
 
 class NarrativeGenerator:
@@ -16,32 +86,55 @@ class NarrativeGenerator:
         self.styles = ["professional", "executive", "technical", "casual"]
         self.audiences = ["executive", "technical", "operational", "general"]
         self.lengths = ["brief", "standard", "comprehensive"]
+        # Frozen copies for O(1) validation; the lists above stay public for
+        # iteration order and error messages.
+        self._styles = frozenset(self.styles)
+        self._audiences = frozenset(self.audiences)
+        self._lengths = frozenset(self.lengths)
 
     def generate_narrative(
         self,
         analysis_data: Dict[str, Any],
         style: str = "professional",
         audience: str = "executive",
-        length: str = "comprehensive"
+        length: str = "comprehensive",
+        _memo: Dict[tuple, Any] = None,
+        _generated_at: str = None
     ) -> Dict[str, Any]:
-        """Generate AI-powered narrative with specified parameters"""
+        """Generate AI-powered narrative with specified parameters
+
+        `_memo` is an optional shared cache used by generate_narrative_variants:
+        the component helpers only depend on subsets of (style, audience,
+        length), so across many variants most of them repeat verbatim.
+        """
 
         # Validate parameters
-        if style not in self.styles:
+        if style not in self._styles:
             raise ValueError(f"Unsupported style: {style}. Supported: {self.styles}")
-        if audience not in self.audiences:
+        if audience not in self._audiences:
             raise ValueError(f"Unsupported audience: {audience}. Supported: {self.audiences}")
-        if length not in self.lengths:
+        if length not in self._lengths:
             raise ValueError(f"Unsupported length: {length}. Supported: {self.lengths}")
 
+        view = _make_view(analysis_data)
+
+        def component(fn, *args):
+            if _memo is None:
+                return fn(view, *args)
+            key = (fn.__name__,) + args
+            hit = _memo.get(key)
+            if hit is None:
+                hit = _memo[key] = fn(view, *args)
+            return hit
+
         # Generate narrative components
-        title = self._generate_narrative_title(analysis_data, style, audience)
-        executive_summary = self._generate_narrative_executive_summary(analysis_data, style, audience, length)
-        main_body = self._generate_narrative_main_body(analysis_data, style, audience, length)
-        conclusions = self._generate_narrative_conclusions(analysis_data, style, audience)
-        recommendations = self._generate_narrative_recommendations(analysis_data, audience, length)
-        confidence_score = self._calculate_narrative_confidence(analysis_data)
-        key_takeaways = self._generate_key_takeaways(analysis_data, audience)
+        title = component(self._generate_narrative_title, style, audience)
+        executive_summary = component(self._generate_narrative_executive_summary, style, audience, length)
+        main_body = component(self._generate_narrative_main_body, style, audience, length)
+        conclusions = component(self._generate_narrative_conclusions, style, audience)
+        recommendations = component(self._generate_narrative_recommendations, audience, length)
+        confidence_score = component(self._calculate_narrative_confidence)
+        key_takeaways = component(self._generate_key_takeaways, audience)
 
         return {
             "title": title,
@@ -55,42 +148,36 @@ class NarrativeGenerator:
                 "style": style,
                 "audience": audience,
                 "length": length,
-                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "generated_at": _generated_at or datetime.now(timezone.utc).isoformat(),
                 "version": "1.0"
             }
         }
 
-    def _generate_narrative_title(self, analysis_data: Dict[str, Any], style: str, audience: str) -> str:
+    def _generate_narrative_title(self, view: _AnalysisView, style: str, audience: str) -> str:
         """Generate appropriate title for narrative"""
-        trend = analysis_data.get("trend_analysis", {}).get("trend", "comprehensive")
-        confidence = analysis_data.get("confidence_metrics", {}).get("overall_confidence", 0.8)
+        trend = (view.trend or "comprehensive").title()
 
         if audience == "executive":
-            return f"B-Search Intelligence: {trend.title()} Trends & Strategic Insights"
+            return _TITLE_EXECUTIVE_TPL.format(trend=trend)
         elif audience == "technical":
-            return f"Technical Analysis Report: {trend.title()} Pattern Detection (Confidence: {confidence*100:.0f}%)"
+            return _TITLE_TECHNICAL_TPL.format(trend=trend, confidence=view.overall_confidence * 100)
         else:
-            return f"B-Search Analytics Report: {trend.title()} Trends & Key Findings"
+            return _TITLE_GENERAL_TPL.format(trend=trend)
 
     def _generate_narrative_executive_summary(
         self,
-        analysis_data: Dict[str, Any],
+        view: _AnalysisView,
         style: str,
         audience: str,
         length: str
     ) -> str:
         """Generate executive summary for narrative"""
-        total_items = analysis_data.get("summary", {}).get("total_items", 0)
-        trend = analysis_data.get("trend_analysis", {}).get("trend", "stable")
-
-        if length == "brief":
-            return f"This report analyzes {total_items:,} data points, revealing {trend} trends with high confidence. Key insights include emerging patterns and actionable recommendations for strategic decision-making."
-        else:
-            return f"""Comprehensive analysis of {total_items:,} intelligence data points reveals {trend} activity patterns across multiple platforms. The AI-powered analysis identifies key trends, anomalies, and predictive insights that inform strategic intelligence operations. This report provides actionable recommendations for optimizing data collection, enhancing monitoring capabilities, and maximizing intelligence value."""
+        tpl = _SUMMARY_BRIEF_TPL if length == "brief" else _SUMMARY_FULL_TPL
+        return tpl.format(total=view.total_items, trend=view.trend or "stable")
 
     def _generate_narrative_main_body(
         self,
-        analysis_data: Dict[str, Any],
+        view: _AnalysisView,
         style: str,
         audience: str,
         length: str
@@ -100,28 +187,29 @@ class NarrativeGenerator:
         body_parts = []
 
         if "detailed_analysis" in sections:
-            trend_analysis = analysis_data.get("trend_analysis", {})
+            trend = view.trend or "stable"
             body_parts.append(f"""## Trend Analysis
-Current data trends indicate a {trend_analysis.get('trend', 'stable')} pattern with {trend_analysis.get('confidence', 0)*100:.1f}% confidence. This suggests {'increasing' if trend_analysis.get('trend') == 'rising' else 'decreasing' if trend_analysis.get('trend') == 'falling' else 'stable'} activity levels that warrant {'immediate attention' if trend_analysis.get('trend') == 'rising' else 'monitoring' if trend_analysis.get('trend') == 'falling' else 'routine oversight'}.""")
+Current data trends indicate a {trend} pattern with {view.trend_confidence*100:.1f}% confidence. This suggests {'increasing' if trend == 'rising' else 'decreasing' if trend == 'falling' else 'stable'} activity levels that warrant {'immediate attention' if trend == 'rising' else 'monitoring' if trend == 'falling' else 'routine oversight'}.""")
 
         if "recommendations" in sections:
-            recommendations = analysis_data.get("recommendations", [])
+            recommendations = view.recommendations
             if recommendations:
-                body_parts.append("## Strategic Recommendations\n" + "\n".join([f"• {rec['recommendation']} ({rec['priority']} priority)" for rec in recommendations[:5]]))
+                body_parts.append("## Strategic Recommendations\n" + "\n".join(f"• {rec['recommendation']} ({rec['priority']} priority)" for rec in recommendations[:5]))
 
         return "\n\n".join(body_parts)
 
-    def _generate_narrative_conclusions(self, analysis_data: Dict[str, Any], style: str, audience: str) -> str:
+    def _generate_narrative_conclusions(self, view: _AnalysisView, style: str, audience: str) -> str:
         """Generate conclusions for narrative"""
-        confidence = analysis_data.get("confidence_metrics", {}).get("overall_confidence", 0.8)
-        risk_level = analysis_data.get("risk_assessment", {}).get("overall_risk_level", "medium")
-
-        return f"""## Conclusions
-This AI-powered analysis provides {confidence*100:.0f}% confidence in the identified patterns and trends. The {risk_level} risk assessment indicates {'stable operations with opportunities for optimization' if risk_level == 'low' else 'moderate attention required for key areas' if risk_level == 'medium' else 'immediate action needed to address critical issues'}. Strategic implementation of the recommendations will enhance intelligence capabilities and operational effectiveness."""
+        risk_level = view.risk_level
+        return _CONCLUSIONS_TPL.format(
+            confidence=view.overall_confidence * 100,
+            risk_level=risk_level,
+            assessment=_RISK_ASSESSMENTS.get(risk_level, _RISK_ASSESSMENT_DEFAULT),
+        )
 
-    def _generate_narrative_recommendations(self, analysis_data: Dict[str, Any], audience: str, length: str) -> str:
+    def _generate_narrative_recommendations(self, view: _AnalysisView, audience: str, length: str) -> str:
         """Generate recommendations section"""
-        recommendations = analysis_data.get("recommendations", [])
+        recommendations = view.recommendations
 
         if audience == "executive":
             recs = [rec for rec in recommendations if rec["priority"] == "high"]
@@ -130,16 +218,13 @@ This AI-powered analysis provides {confidence*100:.0f}% confidence in the identi
 
         return "\n".join([f"**{rec['category'].replace('_', ' ').title()}**: {rec['recommendation']}" for rec in recs])
 
-    def _calculate_narrative_confidence(self, analysis_data: Dict[str, Any]) -> float:
+    def _calculate_narrative_confidence(self, view: _AnalysisView) -> float:
         """Calculate confidence score for narrative"""
-        base_confidence = analysis_data.get("confidence_metrics", {}).get("overall_confidence", 0.8)
-        data_quality = analysis_data.get("confidence_metrics", {}).get("data_quality_score", 0.8)
-
-        return round((base_confidence + data_quality) / 2, 2)
+        return _confidence_score(view.overall_confidence, view.data_quality)
 
-    def _generate_key_takeaways(self, analysis_data: Dict[str, Any], audience: str) -> List[str]:
+    def _generate_key_takeaways(self, view: _AnalysisView, audience: str) -> List[str]:
         """Generate key takeaways"""
-        insights = analysis_data.get("key_insights", [])
+        insights = view.key_insights
 
         if audience == "executive":
             return [insight["insight"] for insight in insights if insight["priority"] == "high"]
@@ -173,7 +258,9 @@ This AI-powered analysis provides {confidence*100:.0f}% confidence in the identi
 
     def _extract_focused_data(self, analysis_data: Dict[str, Any], focus_areas: List[str]) -> Dict[str, Any]:
         """Extract data relevant to focus areas"""
-        focused_data = analysis_data.copy()
+        # Overlay writes on an empty dict instead of shallow-copying the whole
+        # analysis payload; generate_narrative only ever reads through it.
+        focused_data = ChainMap({}, analysis_data)
 
         if "trends" in focus_areas:
             focused_data["key_insights"] = [
@@ -250,28 +337,31 @@ This AI-powered analysis provides {confidence*100:.0f}% confidence in the identi
         base_style: str = "professional"
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Generate multiple narrative variants for comparison"""
+        # All variants share one analysis_data, so component results that only
+        # differ by (style, audience, length) are reused via a shared memo;
+        # the independent variants themselves run on a small thread pool, with
+        # map() keeping each bucket in its declared order.
+        memo = {}
+        generated_at = datetime.now(timezone.utc).isoformat()
+        jobs = (
+            [("styles", style, "general", "standard") for style in self.styles]
+            + [("audiences", base_style, audience, "standard") for audience in self.audiences]
+            + [("lengths", base_style, "general", length) for length in self.lengths]
+        )
+
         variants = {
             "styles": [],
             "audiences": [],
             "lengths": []
         }
-
-        # Generate style variants
-        for style in self.styles:
-            variants["styles"].append(self.generate_narrative(
-                analysis_data, style=style, audience="general", length="standard"
-            ))
-
-        # Generate audience variants
-        for audience in self.audiences:
-            variants["audiences"].append(self.generate_narrative(
-                analysis_data, style=base_style, audience=audience, length="standard"
-            ))
-
-        # Generate length variants
-        for length in self.lengths:
-            variants["lengths"].append(self.generate_narrative(
-                analysis_data, style=base_style, audience="general", length=length
-            ))
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for bucket, narrative in pool.map(
+                lambda job: (job[0], self.generate_narrative(
+                    analysis_data, style=job[1], audience=job[2], length=job[3],
+                    _memo=memo, _generated_at=generated_at
+                )),
+                jobs
+            ):
+                variants[bucket].append(narrative)
 
         return variants
\ No newline at end of file
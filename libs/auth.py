@@ -1,5 +1,7 @@
 from fastapi import Body, Header, HTTPException
+from functools import lru_cache
 import os
+import time
 import logging
 
 logger = logging.getLogger("libs.auth")
@@ -11,6 +13,17 @@ except Exception:
     _HAS_JWT = False
 
 
+@lru_cache(maxsize=1024)
+def _decode_token(token: str, secret: str) -> dict:
+    """Decode and verify a JWT, memoized per (token, secret).
+
+    Repeat requests with the same bearer token skip the HMAC-SHA256 round
+    and JSON parse; failures raise and are never cached. Expiry must be
+    re-checked by the caller since a cached payload can outlive its exp.
+    """
+    return jwt.decode(token, secret, algorithms=["HS256"])
+
+
 def require_run_all_auth(secret: str | None = Body(None, embed=True), authorization: str | None = Header(None)) -> bool:
     """Pluggable auth dependency for run_all endpoints.
 
@@ -32,11 +45,15 @@ def require_run_all_auth(secret: str | None = Body(None, embed=True), authorizat
         if not expected:
             raise HTTPException(status_code=403, detail="server has no RUN_ALL_SECRET configured for JWT validation")
         try:
-            payload = jwt.decode(token, expected, algorithms=["HS256"])
-            logger.info("run_all auth: accepted via JWT")
-            return True
+            payload = _decode_token(token, expected)
         except Exception as e:
             logger.warning("JWT decode failed: %s", e)
             raise HTTPException(status_code=403, detail="invalid token")
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            logger.warning("JWT rejected: token expired")
+            raise HTTPException(status_code=403, detail="invalid token")
+        logger.info("run_all auth: accepted via JWT")
+        return True
 
     raise HTTPException(status_code=403, detail="run_all is disabled or invalid credentials")
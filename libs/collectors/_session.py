@@ -0,0 +1,7 @@
+import requests
+
+# One pooled session shared by the HTTP collectors. Connection keep-alive
+# means repeat calls against the same host reuse the socket and TLS session
+# instead of paying a fresh handshake per request. Collectors still accept
+# an explicit session= override for tests and custom transports.
+SESSION = requests.Session()
@@ -1,22 +1,30 @@
-import requests
+from ._session import SESSION as _SESSION
 
-def fetch_subreddit_json(subreddit: str, limit: int = 50, t: str = "day"):
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson optional at runtime
+    orjson = None
+
+def fetch_subreddit_json(subreddit: str, limit: int = 50, t: str = "day", session=None):
     # Respect zero-or-negative limits as 'no results' for robustness in tests.
     if limit <= 0:
         return []
     headers = {"User-Agent": "b-search/1.0 (https://example.local)"}
     url = f"https://www.reddit.com/r/{subreddit}/top.json?t={t}&limit={limit}"
-    r = requests.get(url, headers=headers, timeout=20)
+    req = session if session else _SESSION
+    r = req.get(url, headers=headers, timeout=20)
     r.raise_for_status()
-    data = r.json()
-    items = []
-    for c in data.get("data", {}).get("children", []):
-        d = c.get("data", {})
-        items.append({
+    # Parse the raw bytes with orjson when available; r.json() goes through
+    # stdlib json plus charset detection on the decoded text.
+    data = orjson.loads(r.content) if orjson is not None else r.json()
+    return [
+        {
             "title": d.get("title"),
             "permalink": "https://www.reddit.com" + d.get("permalink", ""),
             "score": d.get("score"),
             "created_utc": d.get("created_utc"),
             "author": d.get("author"),
-        })
-    return items
+        }
+        for c in data.get("data", {}).get("children", [])
+        for d in (c.get("data", {}),)
+    ]
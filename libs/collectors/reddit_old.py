@@ -1,13 +1,35 @@
-import requests
 from bs4 import BeautifulSoup
 
-def old_reddit_top(subreddit: str, limit: int = 50):
+from ._session import SESSION as _SESSION
+
+try:
+    from selectolax.parser import HTMLParser
+except Exception:  # pragma: no cover - selectolax optional at runtime
+    HTMLParser = None
+
+def old_reddit_top(subreddit: str, limit: int = 50, session=None):
     url = f"https://old.reddit.com/r/{subreddit}/top/?sort=top&t=day"
     headers = {"User-Agent": "b-search/1.0 (https://example.local)"}
-    r = requests.get(url, headers=headers, timeout=20)
+    req = session if session else _SESSION
+    r = req.get(url, headers=headers, timeout=20)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
     posts = []
+    if HTMLParser is not None:
+        # C parser, fed raw bytes so it handles the encoding itself;
+        # roughly an order of magnitude faster than html.parser.
+        for post in HTMLParser(r.content).css("div.thing")[:limit]:
+            title = post.css_first("a.title")
+            if not title:
+                continue
+            attrs = post.attributes
+            posts.append({
+                "title": title.text(strip=True),
+                "permalink": attrs.get("data-permalink"),
+                "score": attrs.get("data-score"),
+                "author": attrs.get("data-author"),
+            })
+        return posts
+    soup = BeautifulSoup(r.text, "html.parser")
     for post in soup.select("div.thing")[:limit]:
         title = post.select_one("a.title")
         if not title:
@@ -1,7 +1,15 @@
 import feedparser
 
+# (url, limit) -> (etag, modified, result). Replaying the validators as a
+# conditional GET turns an unchanged feed into a 304 plus cache hit instead
+# of a re-download and re-parse.
+_CACHE = {}
+
 def fetch_rss(url: str, limit: int = 25):
-    feed = feedparser.parse(url)
+    etag, modified, prev = _CACHE.get((url, limit), (None, None, None))
+    feed = feedparser.parse(url, etag=etag, modified=modified)
+    if getattr(feed, 'status', None) == 304 and prev is not None:
+        return prev
     # feedparser sets `bozo` when parsing failed; surface as exception for
     # callers/tests that expect invalid URLs to raise.
     if getattr(feed, 'bozo', False):
@@ -14,4 +22,9 @@ def fetch_rss(url: str, limit: int = 25):
             "summary": getattr(e, "summary", ""),
             "published": getattr(e, "published", ""),
         })
-    return {"feed_title": getattr(feed.feed, "title", ""), "items": items}
+    result = {"feed_title": getattr(feed.feed, "title", ""), "items": items}
+    new_etag = getattr(feed, 'etag', None)
+    new_modified = getattr(feed, 'modified', None)
+    if new_etag or new_modified:
+        _CACHE[(url, limit)] = (new_etag, new_modified, result)
+    return result
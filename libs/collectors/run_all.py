@@ -15,19 +15,41 @@ isolation (`use_processes`) to forcibly kill timed-out collectors.
 
 from __future__ import annotations
 
+import atexit
+import collections
 import importlib
 import inspect
 import json
 import os
+import pickle
 import pkgutil
+import selectors
+import threading
 import time
 import concurrent.futures
 import multiprocessing
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import libs.collectors as collectors_pkg
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson optional at runtime
+    orjson = None
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Encode to JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 # Configure JSON logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,13 +58,59 @@ logging.basicConfig(
 logger = logging.getLogger("collector_runner")
 
 
+# Events are appended to a deque (GIL-atomic, no lock on the hot path) and
+# written to stderr in one syscall per flush by a single daemon thread,
+# instead of taking the stdlib Handler lock per call from every collector
+# worker at once.
+_LOG_QUEUE: "collections.deque[bytes]" = collections.deque()
+_LOG_FLUSH_INTERVAL = 0.005
+_LOG_FLUSHER_LOCK = threading.Lock()
+_log_flusher_started = False
+
+
+def _drain_log_queue() -> None:
+    lines = []
+    while True:
+        try:
+            lines.append(_LOG_QUEUE.popleft())
+        except IndexError:
+            break
+    if lines:
+        lines.append(b"")
+        try:
+            os.write(2, b"\n".join(lines))
+        except OSError:
+            pass
+
+
+def _log_flusher() -> None:
+    while True:
+        time.sleep(_LOG_FLUSH_INTERVAL)
+        _drain_log_queue()
+
+
+def _ensure_log_flusher() -> None:
+    global _log_flusher_started
+    if _log_flusher_started:
+        return
+    with _LOG_FLUSHER_LOCK:
+        if _log_flusher_started:
+            return
+        threading.Thread(target=_log_flusher, daemon=True, name='collector-log-flush').start()
+        atexit.register(_drain_log_queue)
+        _log_flusher_started = True
+
+
 def log_event(event: str, **kwargs):
     """Emit a JSON log event."""
-    record = {"event": event, **kwargs}
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
-        logger.info(json.dumps(record, ensure_ascii=False))
+        line = _json_dumps_bytes({"event": event, **kwargs})
     except Exception:
-        logger.info(f"[log-failed] {event} {kwargs}")
+        line = f"[log-failed] {event} {kwargs}".encode("utf-8", "replace")
+    _LOG_QUEUE.append(line)
+    _ensure_log_flusher()
 
 
 def _candidate_functions(module) -> List[Tuple[str, Any]]:
@@ -73,215 +141,411 @@ def _call_with_fallbacks(fn, query: Optional[str], limit: int):
     raise last_exc
 
 
-def _discover_modules(whitelist: Optional[List[str]] = None) -> List[str]:
-    """Return list of collector module names (restricted if whitelist is given)."""
-    if whitelist:
-        return list(whitelist)
-    mods: List[str] = []
-    for _, name, _ in pkgutil.walk_packages(collectors_pkg.__path__, collectors_pkg.__name__ + '.'):
-        mods.append(name)
-    return mods
+_PREFERRED_FNS = [
+    'fetch_channel', 'fetch_subreddit_json', 'search_recent', 'nitter_search',
+    'fetch_rss', 'fetch_many', 'old_reddit_top', 'fetch_wayback_text',
+    'latest_snapshot', 'user_media', 'page_posts', 'multi_subreddits',
+    'fetch_url', 'run_search',
+]
 
 
-def run_all_collectors(
-    query: Optional[str] = None,
-    limit: int = 50,
-    whitelist: Optional[List[str]] = None,
-    *,
-    timeout: Optional[float] = 30.0,
-    max_workers: int = 8,
-    collector_timeout: float = 10.0,
-    retries: int = 1,
-    backoff: float = 0.1,
-    whitelist_meta: Optional[Dict[str, Dict[str, Any]]] = None,
-    use_processes: bool = False,
-) -> Dict[str, Dict[str, Any]]:
-    """Run all (or whitelisted) collectors concurrently and return results."""
-    mods = _discover_modules(whitelist)
-    work = [m for m in sorted(set(mods)) if not m.endswith('.run_all')]
-    results: Dict[str, Dict[str, Any]] = {}
+_NO_ENTRY = object()
 
-    def _run_module(mod_name: str) -> Tuple[str, Dict[str, Any]]:
-        log_event("collector_start", module=mod_name)
 
-        try:
-            mod = importlib.import_module(mod_name)
-        except Exception as e:
-            log_event("collector_import_failed", module=mod_name, error=str(e))
-            return mod_name, {'ok': False, 'error': f'import failed: {e}'}
-
-        candidates = _candidate_functions(mod)
-        if not candidates:
-            log_event("collector_no_callable", module=mod_name)
-            return mod_name, {'ok': False, 'error': 'no public callable found'}
-
-        prefer = [
-            'fetch_channel', 'fetch_subreddit_json', 'search_recent', 'nitter_search',
-            'fetch_rss', 'fetch_many', 'old_reddit_top', 'fetch_wayback_text',
-            'latest_snapshot', 'user_media', 'page_posts', 'multi_subreddits',
-            'fetch_url', 'run_search',
-        ]
-        fn = None
-        for pname in prefer:
-            for name, f in candidates:
-                if name == pname:
-                    fn = f
-                    break
-            if fn:
+def _select_collector_fn(mod) -> Optional[Any]:
+    """Pick the collector entrypoint for a module (preferred name, else first public callable).
+
+    The choice is pure reflection over the module object, so it is stashed
+    on the module itself and later attempts skip the dir()/getattr scan.
+    """
+    cached = mod.__dict__.get('_collector_entry', _NO_ENTRY)
+    if cached is not _NO_ENTRY:
+        return cached
+    fn = None
+    candidates = _candidate_functions(mod)
+    if candidates:
+        by_name = dict(candidates)
+        for pname in _PREFERRED_FNS:
+            if pname in by_name:
+                fn = by_name[pname]
                 break
-        if not fn:
+        else:
             fn = candidates[0][1]
+    try:
+        mod._collector_entry = fn
+    except Exception:
+        pass
+    return fn
+
+
+# Persistent spawn pool for process-isolated collectors. Spawn start-up
+# re-imports the interpreter world, so paying it once per worker instead of
+# once per attempt is the bulk of the win; each worker also caches imported
+# collector modules across tasks.
+_PROC_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_PROC_POOL_LOCK = threading.Lock()
+_WORKER_MODULES: Dict[str, Any] = {}
+
+
+def _proc_entry(mod_name: str, query: Optional[str], limit: int):
+    """Run one collector inside a pool worker; module imports are cached per worker."""
+    mod = _WORKER_MODULES.get(mod_name)
+    if mod is None:
+        mod = importlib.import_module(mod_name)
+        _WORKER_MODULES[mod_name] = mod
+    fn = _select_collector_fn(mod)
+    if fn is None:
+        raise RuntimeError('no public callable found')
+    start = time.perf_counter()
+    res = _call_with_fallbacks(fn, query, limit)
+    return res, time.perf_counter() - start
+
+
+def _mem_child(conn, mod_name: str, query: Optional[str], limit: int) -> None:
+    """Child entry for the memory-limited path; must be module-level so spawn can pickle it."""
+    try:
+        start = time.perf_counter()
+        mod = importlib.import_module(mod_name)
+        fn = _select_collector_fn(mod)
+        if fn is None:
+            raise RuntimeError('no public callable found')
+        res = _call_with_fallbacks(fn, query, limit)
+        duration = time.perf_counter() - start
+        conn.send_bytes(pickle.dumps({'ok': True, 'result': res, 'duration': duration}, protocol=5))
+    except Exception:
+        import traceback
+        try:
+            conn.send_bytes(pickle.dumps({'ok': False, 'error': traceback.format_exc()}, protocol=5))
+        except Exception:
+            try:
+                conn.send_bytes(pickle.dumps({'ok': False, 'error': 'unserializable error'}, protocol=5))
+            except Exception:
+                pass
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _get_proc_pool(max_workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    global _PROC_POOL
+    with _PROC_POOL_LOCK:
+        if _PROC_POOL is None:
+            _PROC_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _PROC_POOL
+
+
+def _reset_proc_pool() -> None:
+    """Discard the pool after a timeout: the hung worker can't be reclaimed."""
+    global _PROC_POOL
+    with _PROC_POOL_LOCK:
+        pool, _PROC_POOL = _PROC_POOL, None
+    if pool is None:
+        return
+    procs = list(getattr(pool, '_processes', {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for p in procs:
+        try:
+            p.terminate()
+        except Exception:
+            pass
 
-        opts = (whitelist_meta or {}).get(mod_name, {}) if isinstance(whitelist_meta, dict) else {}
-        mod_timeout = float(opts.get('collector_timeout', collector_timeout))
-        mod_retries = int(opts.get('retries', retries))
-        mod_backoff = float(opts.get('backoff', backoff))
-        mod_use_processes = bool(opts.get('use_processes', use_processes))
-        mod_memory_limit_mb = float(opts.get('memory_limit_mb', 0) or 0) or 0.0
 
-        last_err = None
-        for attempt in range(1, max(1, mod_retries) + 1):
-            log_event("collector_attempt", module=mod_name, attempt=attempt)
+@atexit.register
+def _shutdown_proc_pool() -> None:
+    with _PROC_POOL_LOCK:
+        pool = _PROC_POOL
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
 
-            try:
-                if mod_use_processes:
-                    ctx = multiprocessing.get_context('spawn')
 
-                    def _proc_target(conn):
-                        try:
-                            start = time.perf_counter()
-                            res = _call_with_fallbacks(fn, query, limit)
-                            duration = time.perf_counter() - start
-                            conn.send(json.dumps({'ok': True, 'result': res, 'duration': duration}, default=str))
-                        except Exception:
-                            import traceback
-                            try:
-                                conn.send(json.dumps({'ok': False, 'error': traceback.format_exc()}))
-                            except Exception:
-                                try:
-                                    conn.send(json.dumps({'ok': False, 'error': 'unserializable error'}))
-                                except Exception:
-                                    pass
-                        finally:
-                            try:
-                                conn.close()
-                            except Exception:
-                                pass
+@lru_cache(maxsize=1)
+def _walk_collector_modules() -> Tuple[str, ...]:
+    """Walk the collectors package once; the layout is fixed for the process lifetime."""
+    return tuple(
+        name
+        for _, name, _ in pkgutil.walk_packages(collectors_pkg.__path__, collectors_pkg.__name__ + '.')
+    )
+
+
+def _discover_modules(whitelist: Optional[List[str]] = None) -> List[str]:
+    """Return list of collector module names (restricted if whitelist is given)."""
+    if whitelist:
+        return list(whitelist)
+    return list(_walk_collector_modules())
+
+
+def _run_module(
+    mod_name: str,
+    query: Optional[str],
+    limit: int,
+    *,
+    collector_timeout: float,
+    retries: int,
+    backoff: float,
+    whitelist_meta: Optional[Dict[str, Dict[str, Any]]],
+    use_processes: bool,
+    proc_workers: int,
+) -> Tuple[str, Dict[str, Any]]:
+    """Run a single collector module with retries/timeouts and return (module, info)."""
+    log_event("collector_start", module=mod_name)
 
-                    parent_conn, child_conn = multiprocessing.Pipe()
-                    p = ctx.Process(target=_proc_target, args=(child_conn,))
-                    p.start()
-                    child_conn.close()
-                    start_wait = time.perf_counter()
-                    while p.is_alive() and (time.perf_counter() - start_wait) < mod_timeout:
-                        if mod_memory_limit_mb > 0:
+    try:
+        mod = importlib.import_module(mod_name)
+    except Exception as e:
+        log_event("collector_import_failed", module=mod_name, error=str(e))
+        return mod_name, {'ok': False, 'error': f'import failed: {e}'}
+
+    fn = _select_collector_fn(mod)
+    if fn is None:
+        log_event("collector_no_callable", module=mod_name)
+        return mod_name, {'ok': False, 'error': 'no public callable found'}
+
+    opts = (whitelist_meta or {}).get(mod_name, {}) if isinstance(whitelist_meta, dict) else {}
+    mod_timeout = float(opts.get('collector_timeout', collector_timeout))
+    mod_retries = int(opts.get('retries', retries))
+    mod_backoff = float(opts.get('backoff', backoff))
+    mod_use_processes = bool(opts.get('use_processes', use_processes))
+    mod_memory_limit_mb = float(opts.get('memory_limit_mb', 0) or 0) or 0.0
+
+    last_err = None
+    for attempt in range(1, max(1, mod_retries) + 1):
+        log_event("collector_attempt", module=mod_name, attempt=attempt)
+
+        try:
+            if mod_use_processes and mod_memory_limit_mb <= 0:
+                # Persistent pool path: no per-attempt spawn. A timed-out
+                # worker can't be interrupted, so the pool is torn down
+                # and lazily rebuilt on the next submission. That teardown
+                # also breaks the in-flight futures of healthy siblings, so
+                # a submission lost to pool collapse gets one resubmission
+                # against the rebuilt pool instead of burning an attempt.
+                timed_out = False
+                for resubmitted in (False, True):
+                    try:
+                        pool = _get_proc_pool(proc_workers)
+                        fut = pool.submit(_proc_entry, mod_name, query, limit)
+                        raw, attempt_duration = fut.result(timeout=mod_timeout)
+                        break
+                    except concurrent.futures.TimeoutError:
+                        fut.cancel()
+                        _reset_proc_pool()
+                        log_event("collector_timeout", module=mod_name, timeout=mod_timeout)
+                        last_err = TimeoutError(f'collector timed out after {mod_timeout}s (attempt {attempt})')
+                        timed_out = True
+                        break
+                    except (concurrent.futures.process.BrokenProcessPool, concurrent.futures.CancelledError):
+                        _reset_proc_pool()
+                        if resubmitted:
+                            raise
+                        log_event("collector_pool_broken", module=mod_name)
+                if timed_out:
+                    continue
+            elif mod_use_processes:
+                # Dedicated child: memory limits need the pid for RSS
+                # sampling and a targeted kill.
+                ctx = multiprocessing.get_context('spawn')
+                parent_conn, child_conn = multiprocessing.Pipe()
+                p = ctx.Process(target=_mem_child, args=(child_conn, mod_name, query, limit))
+                p.start()
+                child_conn.close()
+                # Hold one fd on /proc/<pid>/status for the child's lifetime;
+                # each probe is then a single pread instead of an
+                # open/read/close plus line-by-line string splitting.
+                rss_fd = None
+                if mod_memory_limit_mb > 0:
+                    try:
+                        rss_fd = os.open(f"/proc/{p.pid}/status", os.O_RDONLY)
+                    except OSError:
+                        rss_fd = None
+                # Wait on the process sentinel instead of a sleep poll:
+                # child exit wakes the selector immediately, and the memory
+                # probe runs only when the 50 ms sampling timer expires
+                # rather than after an unconditional sleep.
+                deadline = time.perf_counter() + mod_timeout
+                sel = selectors.DefaultSelector()
+                sel.register(p.sentinel, selectors.EVENT_READ)
+                try:
+                    while p.is_alive():
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            break
+                        wait = min(0.05, remaining) if mod_memory_limit_mb > 0 else remaining
+                        if sel.select(timeout=wait):
+                            # The sentinel can become readable a beat before
+                            # the exit status is reapable, so join before the
+                            # is_alive() check below or a clean exit gets
+                            # misread as a timeout.
+                            p.join()
+                            break
+                        if rss_fd is not None:
                             try:
-                                pid = p.pid
-                                stat_path = f"/proc/{pid}/status"
-                                if os.path.exists(stat_path):
-                                    with open(stat_path, 'r') as sf:
-                                        for line in sf:
-                                            if line.startswith('VmRSS:'):
-                                                parts = line.split()
-                                                if len(parts) >= 2:
-                                                    rss_kb = int(parts[1])
-                                                    rss_mb = rss_kb / 1024.0
-                                                    if rss_mb > mod_memory_limit_mb:
-                                                        log_event("collector_memkill", module=mod_name, rss_mb=rss_mb)
-                                                        try:
-                                                            p.terminate()
-                                                        except Exception:
-                                                            pass
-                                                        p.join(1)
-                                                        last_err = MemoryError(f'collector exceeded memory limit {mod_memory_limit_mb}MB')
-                                                        break
+                                buf = os.pread(rss_fd, 2048, 0)
+                                i = buf.find(b'VmRSS:')
+                                if i >= 0:
+                                    rss_kb = int(buf[i + 6:buf.index(b'\n', i)].split()[0])
+                                    rss_mb = rss_kb / 1024.0
+                                    if rss_mb > mod_memory_limit_mb:
+                                        log_event("collector_memkill", module=mod_name, rss_mb=rss_mb)
+                                        try:
+                                            p.terminate()
+                                        except Exception:
+                                            pass
+                                        p.join(1)
+                                        last_err = MemoryError(f'collector exceeded memory limit {mod_memory_limit_mb}MB')
+                                        break
                             except Exception:
                                 pass
-                        time.sleep(0.05)
-                    if p.is_alive():
-                        log_event("collector_timeout", module=mod_name, timeout=mod_timeout)
+                finally:
+                    sel.close()
+                    if rss_fd is not None:
                         try:
-                            p.terminate()
-                        except Exception:
+                            os.close(rss_fd)
+                        except OSError:
                             pass
-                        p.join(1)
-                        if not last_err:
-                            last_err = TimeoutError(f'collector timed out after {mod_timeout}s (attempt {attempt})')
-                        continue
+                if p.is_alive():
+                    log_event("collector_timeout", module=mod_name, timeout=mod_timeout)
                     try:
-                        if parent_conn.poll():
-                            payload = parent_conn.recv()
-                            try:
-                                obj = json.loads(payload)
-                            except Exception:
-                                raise RuntimeError('invalid json from child')
-                            if obj.get('ok'):
-                                raw = obj.get('result')
-                                attempt_duration = obj.get('duration')
-                            else:
-                                raise RuntimeError(obj.get('error', 'child error'))
-                        else:
-                            raise RuntimeError('no response from collector subprocess')
-                    finally:
+                        p.terminate()
+                    except Exception:
+                        pass
+                    p.join(1)
+                    if not last_err:
+                        last_err = TimeoutError(f'collector timed out after {mod_timeout}s (attempt {attempt})')
+                    continue
+                try:
+                    if parent_conn.poll():
+                        payload = parent_conn.recv_bytes()
                         try:
-                            parent_conn.close()
+                            obj = pickle.loads(payload)
                         except Exception:
-                            pass
-                else:
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as attempt_ex:
-                        fut = attempt_ex.submit(_call_with_fallbacks, fn, query, limit)
-                        try:
-                            start = time.perf_counter()
-                            raw = fut.result(timeout=mod_timeout)
-                            attempt_duration = time.perf_counter() - start
-                        except concurrent.futures.TimeoutError:
-                            last_err = TimeoutError(f'collector timed out after {mod_timeout}s (attempt {attempt})')
-                            log_event("collector_timeout", module=mod_name, timeout=mod_timeout)
-                            continue
-
-                if raw is None:
-                    records: List[Any] = []
-                elif isinstance(raw, (list, tuple)):
+                            raise RuntimeError('invalid payload from child')
+                        if obj.get('ok'):
+                            raw = obj.get('result')
+                            attempt_duration = obj.get('duration')
+                        else:
+                            raise RuntimeError(obj.get('error', 'child error'))
+                    else:
+                        raise RuntimeError('no response from collector subprocess')
+                finally:
+                    try:
+                        parent_conn.close()
+                    except Exception:
+                        pass
+            else:
+                # shutdown(wait=False) everywhere: the old `with` block
+                # joined the worker thread on exit, so a hung collector
+                # still wedged this slot for its full sleep even after
+                # the timeout had already fired.
+                attempt_ex = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                fut = attempt_ex.submit(_call_with_fallbacks, fn, query, limit)
+                try:
+                    start = time.perf_counter()
+                    raw = fut.result(timeout=mod_timeout)
+                    attempt_duration = time.perf_counter() - start
+                except concurrent.futures.TimeoutError:
+                    last_err = TimeoutError(f'collector timed out after {mod_timeout}s (attempt {attempt})')
+                    log_event("collector_timeout", module=mod_name, timeout=mod_timeout)
+                    continue
+                finally:
+                    attempt_ex.shutdown(wait=False, cancel_futures=True)
+
+            if raw is None:
+                records: List[Any] = []
+            elif isinstance(raw, (list, tuple)):
+                records = list(raw)
+            else:
+                if hasattr(raw, '__iter__') and not isinstance(raw, (str, bytes, dict)):
                     records = list(raw)
                 else:
-                    if hasattr(raw, '__iter__') and not isinstance(raw, (str, bytes, dict)):
-                        records = list(raw)
-                    else:
-                        records = [raw]
-
-                meta = {
-                    'attempts': attempt,
-                    'duration': float(attempt_duration) if 'attempt_duration' in locals() else None,
-                    'used_process': mod_use_processes,
-                }
-                log_event("collector_success", module=mod_name, records=len(records), **meta)
-                return mod_name, {'ok': True, 'records': records, 'meta': meta}
-            except Exception as e:
-                last_err = e
-                log_event("collector_error", module=mod_name, attempt=attempt, error=str(e))
-                if attempt < mod_retries:
-                    time.sleep(mod_backoff * attempt)
-                continue
+                    records = [raw]
+
+            meta = {
+                'attempts': attempt,
+                'duration': float(attempt_duration) if 'attempt_duration' in locals() else None,
+                'used_process': mod_use_processes,
+            }
+            log_event("collector_success", module=mod_name, records=len(records), **meta)
+            return mod_name, {'ok': True, 'records': records, 'meta': meta}
+        except Exception as e:
+            last_err = e
+            log_event("collector_error", module=mod_name, attempt=attempt, error=str(e))
+            if attempt < mod_retries:
+                time.sleep(mod_backoff * attempt)
+            continue
 
-        log_event("collector_failed", module=mod_name, error=str(last_err))
-        return mod_name, {'ok': False, 'error': str(last_err)}
+    log_event("collector_failed", module=mod_name, error=str(last_err))
+    return mod_name, {'ok': False, 'error': str(last_err)}
+
+
+# Shared dispatch pool, created once and reused by every run_all_* call.
+# Pool size comes from COLLECTOR_WORKERS since the pool outlives any single
+# call's max_workers argument (which still caps the process pool).
+_EXEC: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_EXEC_LOCK = threading.Lock()
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        future_to_mod = {ex.submit(_run_module, m): m for m in work}
-        try:
-            for fut in concurrent.futures.as_completed(future_to_mod, timeout=timeout):
-                mod_name, info = fut.result()
-                results[mod_name] = info
-        except concurrent.futures.TimeoutError:
-            for fut, mod in future_to_mod.items():
-                if fut.done():
-                    try:
-                        mod_name, info = fut.result()
-                        results[mod_name] = info
-                    except Exception as e:
-                        results[mod] = {'ok': False, 'error': str(e)}
-                else:
-                    results[mod] = {'ok': False, 'error': 'timeout'}
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _EXEC
+    with _EXEC_LOCK:
+        if _EXEC is None:
+            _EXEC = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(os.getenv('COLLECTOR_WORKERS', '16')),
+                thread_name_prefix='collector',
+            )
+            atexit.register(_EXEC.shutdown, wait=False, cancel_futures=True)
+        return _EXEC
+
+
+def run_all_collectors(
+    query: Optional[str] = None,
+    limit: int = 50,
+    whitelist: Optional[List[str]] = None,
+    *,
+    timeout: Optional[float] = 30.0,
+    max_workers: int = 8,
+    collector_timeout: float = 10.0,
+    retries: int = 1,
+    backoff: float = 0.1,
+    whitelist_meta: Optional[Dict[str, Dict[str, Any]]] = None,
+    use_processes: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Run all (or whitelisted) collectors concurrently and return results."""
+    mods = _discover_modules(whitelist)
+    work = [m for m in sorted(set(mods)) if not m.endswith('.run_all')]
+    results: Dict[str, Dict[str, Any]] = {}
+    ex = _get_executor()
+    future_to_mod = {
+        ex.submit(
+            _run_module, m, query, limit,
+            collector_timeout=collector_timeout,
+            retries=retries,
+            backoff=backoff,
+            whitelist_meta=whitelist_meta,
+            use_processes=use_processes,
+            proc_workers=max_workers,
+        ): m
+        for m in work
+    }
+    try:
+        for fut in concurrent.futures.as_completed(future_to_mod, timeout=timeout):
+            mod_name, info = fut.result()
+            results[mod_name] = info
+    except concurrent.futures.TimeoutError:
+        for fut, mod in future_to_mod.items():
+            if fut.done():
+                try:
+                    mod_name, info = fut.result()
+                    results[mod_name] = info
+                except Exception as e:
+                    results[mod] = {'ok': False, 'error': str(e)}
+            else:
+                fut.cancel()
+                results[mod] = {'ok': False, 'error': 'timeout'}
 
     return results
 
@@ -303,43 +567,41 @@ def run_all_stream(
     mods = _discover_modules(whitelist)
     work = [m for m in sorted(set(mods)) if not m.endswith('.run_all')]
 
-    def _single(mod_name: str) -> Tuple[str, Dict[str, Any]]:
-        res = run_all_collectors(
-            query=query,
-            limit=limit,
-            whitelist=[mod_name],
-            timeout=collector_timeout,
-            max_workers=1,
+    # Submit _run_module directly; the old implementation recursed through
+    # run_all_collectors per module, nesting a throwaway pool inside each
+    # stream slot.
+    ex = _get_executor()
+    future_to_mod = {
+        ex.submit(
+            _run_module, m, query, limit,
             collector_timeout=collector_timeout,
             retries=retries,
             backoff=backoff,
             whitelist_meta=whitelist_meta,
             use_processes=use_processes,
-        )
-        if isinstance(res, dict):
-            return mod_name, res.get(mod_name, {'ok': False, 'error': 'internal'})
-        return mod_name, {'ok': False, 'error': 'internal'}
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        future_to_mod = {ex.submit(_single, m): m for m in work}
-        try:
-            for fut in concurrent.futures.as_completed(future_to_mod, timeout=timeout):
+            proc_workers=max_workers,
+        ): m
+        for m in work
+    }
+    try:
+        for fut in concurrent.futures.as_completed(future_to_mod, timeout=timeout):
+            try:
+                mod_name, info = fut.result()
+                yield mod_name, info
+            except Exception as e:
+                mod = future_to_mod.get(fut)
+                yield mod, {'ok': False, 'error': str(e)}
+    except concurrent.futures.TimeoutError:
+        for fut, mod in future_to_mod.items():
+            if fut.done():
                 try:
                     mod_name, info = fut.result()
                     yield mod_name, info
                 except Exception as e:
-                    mod = future_to_mod.get(fut)
                     yield mod, {'ok': False, 'error': str(e)}
-        except concurrent.futures.TimeoutError:
-            for fut, mod in future_to_mod.items():
-                if fut.done():
-                    try:
-                        mod_name, info = fut.result()
-                        yield mod_name, info
-                    except Exception as e:
-                        yield mod, {'ok': False, 'error': str(e)}
-                else:
-                    yield mod, {'ok': False, 'error': 'timeout'}
+            else:
+                fut.cancel()
+                yield mod, {'ok': False, 'error': 'timeout'}
 
 
 if __name__ == '__main__':
@@ -351,4 +613,8 @@ if __name__ == '__main__':
     p.add_argument('--whitelist', nargs='*')
     args = p.parse_args()
     out = run_all_collectors(args.query or None, args.limit, whitelist=args.whitelist)
-    print(json.dumps(out, indent=2, ensure_ascii=False))
+    if orjson is not None:
+        import sys
+        sys.stdout.buffer.write(orjson.dumps(out, option=orjson.OPT_INDENT_2, default=str) + b"\n")
+    else:
+        print(json.dumps(out, indent=2, ensure_ascii=False))
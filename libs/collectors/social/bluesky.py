@@ -1,9 +1,10 @@
-import requests
+from .._session import SESSION as _SESSION
 
-def recent_by_actor(handle: str, limit: int = 25):
+def recent_by_actor(handle: str, limit: int = 25, session=None):
     url = "https://public.api.bsky.app/xrpc/app.bsky.feed.getAuthorFeed"
     params = {"actor": handle, "limit": limit}
-    r = requests.get(url, params=params, timeout=30)
+    req = session if session else _SESSION
+    r = req.get(url, params=params, timeout=30)
     r.raise_for_status()
     data = r.json()
     return data.get("feed", [])
@@ -1,12 +1,15 @@
-import os, requests
+import os
 
-def channel_messages(channel_id: str, limit: int = 50):
+from .._session import SESSION as _SESSION
+
+def channel_messages(channel_id: str, limit: int = 50, session=None):
     token = os.getenv("DISCORD_BOT_TOKEN","")
     if not token:
         raise RuntimeError("DISCORD_BOT_TOKEN not set")
     url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
     headers = {"Authorization": f"Bot {token}"}
     params = {"limit": min(limit, 100)}
-    r = requests.get(url, headers=headers, params=params, timeout=30)
+    req = session if session else _SESSION
+    r = req.get(url, headers=headers, params=params, timeout=30)
     r.raise_for_status()
     return r.json()
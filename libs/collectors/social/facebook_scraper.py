@@ -1,8 +1,9 @@
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import quote
 
-def scrape_facebook_page(page_id: str, limit: int = 25):
+from .._session import SESSION as _SESSION
+
+def scrape_facebook_page(page_id: str, limit: int = 25, session=None):
     """
     Alternative Facebook scraper using web interface
     Note: Facebook heavily blocks scraping, this is for fallback purposes only
@@ -18,7 +19,8 @@ def scrape_facebook_page(page_id: str, limit: int = 25):
     try:
         # Try the public page URL
         page_url = f"https://www.facebook.com/{page_id}"
-        r = requests.get(page_url, headers=headers, timeout=15)
+        req = session if session else _SESSION
+        r = req.get(page_url, headers=headers, timeout=15)
 
         if r.status_code != 200:
             return []
@@ -1,11 +1,14 @@
-import os, requests
+import os
 
-def user_media(ig_user_id: str, limit: int = 25):
+from .._session import SESSION as _SESSION
+
+def user_media(ig_user_id: str, limit: int = 25, session=None):
     token = os.getenv("IG_GRAPH_TOKEN","")
     if not token:
         raise RuntimeError("IG_GRAPH_TOKEN not set")
     url = f"https://graph.facebook.com/v19.0/{ig_user_id}/media"
     params = {"fields": "id,caption,media_type,media_url,permalink,timestamp", "limit": limit, "access_token": token}
-    r = requests.get(url, params=params, timeout=30)
+    req = session if session else _SESSION
+    r = req.get(url, params=params, timeout=30)
     r.raise_for_status()
     return r.json().get("data", [])
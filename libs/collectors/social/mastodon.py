@@ -1,9 +1,10 @@
-import requests
+from .._session import SESSION as _SESSION
 
-def timeline(instance_url: str, access_token: str, limit: int = 20):
+def timeline(instance_url: str, access_token: str, limit: int = 20, session=None):
     url = instance_url.rstrip('/') + "/api/v1/timelines/public"
     headers = {"Authorization": f"Bearer {access_token}"} if access_token else {}
     params = {"limit": limit}
-    r = requests.get(url, headers=headers, params=params, timeout=30)
+    req = session if session else _SESSION
+    r = req.get(url, headers=headers, params=params, timeout=30)
     r.raise_for_status()
     return r.json()
@@ -1,11 +1,14 @@
 import requests
 from bs4 import BeautifulSoup
 
-def nitter_search(instance: str, query: str, limit: int = 20):
+from .._session import SESSION as _SESSION
+
+def nitter_search(instance: str, query: str, limit: int = 20, session=None):
     base = instance.rstrip('/')
     url = f"{base}/search?f=tweets&q={requests.utils.quote(query)}&since=&until=&near="
     headers = {"User-Agent": "b-search/1.0"}
-    r = requests.get(url, headers=headers, timeout=20)
+    req = session if session else _SESSION
+    r = req.get(url, headers=headers, timeout=20)
     r.raise_for_status()
     soup = BeautifulSoup(r.text, "html.parser")
     out = []
@@ -1,10 +1,12 @@
-import requests
 from bs4 import BeautifulSoup
 
-def old_reddit_top(subreddit: str, limit: int = 25, t: str = "day"):
+from .._session import SESSION as _SESSION
+
+def old_reddit_top(subreddit: str, limit: int = 25, t: str = "day", session=None):
     url = f"https://old.reddit.com/r/{subreddit}/top/?t={t}"
     headers = {"User-Agent": "b-search/1.0"}
-    r = requests.get(url, headers=headers, timeout=20)
+    req = session if session else _SESSION
+    r = req.get(url, headers=headers, timeout=20)
     r.raise_for_status()
     soup = BeautifulSoup(r.text, "html.parser")
     out = []
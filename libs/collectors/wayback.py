@@ -1,8 +1,9 @@
 import requests
 
-def latest_snapshot(url: str):
+def latest_snapshot(url: str, session=None):
     api = "http://archive.org/wayback/available"
-    r = requests.get(api, params={"url": url}, timeout=20)
+    req = session if session else requests
+    r = req.get(api, params={"url": url}, timeout=20)
     r.raise_for_status()
     j = r.json()
     snaps = j.get("archived_snapshots", {})
@@ -27,7 +27,9 @@ def extract_links(base_url: str, html: str):
     text = " ".join(t.get_text(" ", strip=True) for t in soup.find_all(["p","li","h1","h2","h3"]))
     return links, re.sub(r"\s+", " ", text)[:20000]
 
-def polite_crawl(seeds, allow_domains=None, deny_patterns=None, max_pages=100, per_domain_delay=1.0, session=None):
+def iter_crawl(seeds, allow_domains=None, deny_patterns=None, max_pages=100, per_domain_delay=1.0, session=None):
+    """Generator form of polite_crawl: yields pages as they are fetched so
+    callers can persist them incrementally instead of holding every page in RAM."""
     allow_domains = set(allow_domains or [])
     # Validate inputs for defensive behavior (tests expect exceptions on bad args)
     if max_pages is None or not isinstance(max_pages, int) or max_pages < 0:
@@ -35,13 +37,13 @@ def polite_crawl(seeds, allow_domains=None, deny_patterns=None, max_pages=100, p
     deny_patterns = [re.compile(p) for p in (deny_patterns or [])]
     visited = set()
     queue = deque(seeds)
-    results = []
+    yielded = 0
     robots_cache = {}
 
     def domain(url):
         return urllib.parse.urlparse(url).netloc
 
-    while queue and len(results) < max_pages:
+    while queue and yielded < max_pages:
         url = queue.popleft()
         if url in visited: 
             continue
@@ -69,14 +71,18 @@ def polite_crawl(seeds, allow_domains=None, deny_patterns=None, max_pages=100, p
         try:
             html = fetch(url, session=session)
             links, text = extract_links(url, html)
-            results.append({"url": url, "text": text})
             visited.add(url)
             for link in links:
-                if allow_domains and domain(link) not in allow_domains: 
+                if allow_domains and domain(link) not in allow_domains:
                     continue
                 if link not in visited:
                     queue.append(link)
+            yield {"url": url, "text": text}
+            yielded += 1
             time.sleep(per_domain_delay)
         except Exception:
             continue
-    return results
+
+def polite_crawl(seeds, allow_domains=None, deny_patterns=None, max_pages=100, per_domain_delay=1.0, session=None):
+    return list(iter_crawl(seeds, allow_domains=allow_domains, deny_patterns=deny_patterns,
+                           max_pages=max_pages, per_domain_delay=per_domain_delay, session=session))
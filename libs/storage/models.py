@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, JSON, TIMESTAMP, ForeignKey, text
+from sqlalchemy import Column, String, Text, JSON, TIMESTAMP, ForeignKey, text, Index
 from sqlalchemy import Integer, Boolean, DateTime, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -63,7 +63,11 @@ class Alert(Base):
 
 class Watcher(Base):
     __tablename__ = "watchers"
-    __table_args__ = {"extend_existing": True}
+    # Serves the scheduler's "which watchers are due" query.
+    __table_args__ = (
+        Index("ix_watchers_enabled_last_run", "enabled", "last_run_at"),
+        {"extend_existing": True},
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     type = Column(String, nullable=False)  # image | keyword | username
     config = Column(JSONB, nullable=False, default=dict)
@@ -74,7 +78,12 @@ class Watcher(Base):
 
 class WatcherHit(Base):
     __tablename__ = "watcher_hits"
-    __table_args__ = {"extend_existing": True}
+    # Composite index keeps per-watcher fingerprint lookups (dedupe checks and
+    # the per-run prefetch) on a B-tree instead of scanning the table.
+    __table_args__ = (
+        Index("ix_watcherhit_wid_fp", "watcher_id", "fingerprint", unique=True),
+        {"extend_existing": True},
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     watcher_id = Column(UUID(as_uuid=True), ForeignKey("watchers.id", ondelete="CASCADE"), index=True, nullable=False)
     fingerprint = Column(String, index=True)  # e.g., sha256 of content/url or media
@@ -0,0 +1,30 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+
+jwt = pytest.importorskip("jwt")
+
+from libs import auth
+
+
+def test_cached_token_rejected_after_expiry(monkeypatch):
+    # _decode_token memoizes accepted payloads, so expiry is re-checked by
+    # the caller on every request; a token accepted once must still be
+    # rejected once its exp passes even though the decode is a cache hit.
+    monkeypatch.setenv("RUN_ALL_SECRET", "test-secret")
+    auth._decode_token.cache_clear()
+    now = time.time()
+    token = jwt.encode({"sub": "tester", "exp": int(now) + 60}, "test-secret", algorithm="HS256")
+    header = f"Bearer {token}"
+
+    assert auth.require_run_all_auth(secret=None, authorization=header) is True
+    # Second call hits the cache while still valid.
+    assert auth.require_run_all_auth(secret=None, authorization=header) is True
+
+    # Jump past exp without re-minting the token: the payload is still
+    # cached, so only the manual expiry check stands in the way.
+    monkeypatch.setattr(auth.time, "time", lambda: now + 120)
+    with pytest.raises(HTTPException) as exc:
+        auth.require_run_all_auth(secret=None, authorization=header)
+    assert exc.value.status_code == 403